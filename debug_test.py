@@ -41,7 +41,7 @@ async def test_pipeline():
         # Process the document
         print("\n🔄 Processing document through pipeline...")
         result = await pipeline_service.process_rfp_documents(
-            document_paths=[test_file],
+            document_sources=[test_file],
             set_name="Test RFP",
             set_description="Test document for debugging"
         )
@@ -55,6 +55,7 @@ async def test_pipeline():
         # Clean up
         import os
         os.unlink(test_file)
+        await pipeline_service.aclose()
         
         return True
         
@@ -11,7 +11,7 @@ interface ProgressData {
 }
 
 interface WebSocketMessage {
-  type: 'progress_update' | 'step_update' | 'error' | 'complete';
+  type: 'progress_update' | 'step_update' | 'error' | 'complete' | 'heartbeat' | 'queued';
   session_id: string;
   timestamp: string;
   data: any;
@@ -51,11 +51,6 @@ const useWebSocket = (): UseWebSocketReturn => {
         console.log('WebSocket connected:', sessionId);
         setIsConnected(true);
         setError(null);
-        
-        // Send ping to keep connection alive
-        if (wsRef.current) {
-          wsRef.current.send('ping');
-        }
       };
 
       wsRef.current.onmessage = (event) => {
@@ -64,63 +59,75 @@ const useWebSocket = (): UseWebSocketReturn => {
             return; // Ignore pong responses
           }
 
-          const message: WebSocketMessage = JSON.parse(event.data);
-          console.log('WebSocket message:', message);
-
-          switch (message.type) {
-            case 'progress_update':
-              setProgress(prevProgress => ({
-                ...prevProgress,
-                ...message.data,
-                steps: prevProgress?.steps || []
-              }));
-              break;
-
-            case 'step_update':
-              setProgress(prevProgress => {
-                if (!prevProgress) return null;
+          // Batched updates arrive as a JSON array of messages
+          const payload = JSON.parse(event.data);
+          const messages: WebSocketMessage[] = Array.isArray(payload) ? payload : [payload];
+
+          for (const message of messages) {
+            console.log('WebSocket message:', message);
+
+            switch (message.type) {
+              case 'progress_update':
+                setProgress(prevProgress => ({
+                  ...prevProgress,
+                  ...message.data,
+                  steps: prevProgress?.steps || []
+                }));
+                break;
+
+              case 'step_update':
+                setProgress(prevProgress => {
+                  if (!prevProgress) return null;
                 
-                const stepIndex = prevProgress.steps.findIndex(
-                  step => step.step_id === message.data.step_id
-                );
+                  const stepIndex = prevProgress.steps.findIndex(
+                    step => step.step_id === message.data.step_id
+                  );
                 
-                if (stepIndex !== -1) {
-                  const updatedSteps = [...prevProgress.steps];
-                  updatedSteps[stepIndex] = {
-                    ...updatedSteps[stepIndex],
-                    ...message.data
-                  };
+                  if (stepIndex !== -1) {
+                    const updatedSteps = [...prevProgress.steps];
+                    updatedSteps[stepIndex] = {
+                      ...updatedSteps[stepIndex],
+                      ...message.data
+                    };
                   
-                  return {
-                    ...prevProgress,
-                    steps: updatedSteps
-                  };
-                }
+                    return {
+                      ...prevProgress,
+                      steps: updatedSteps
+                    };
+                  }
                 
-                return prevProgress;
-              });
-              break;
-
-            case 'error':
-              setError(message.data.error || 'Unknown error occurred');
-              setProgress(prevProgress => ({
-                ...prevProgress!,
-                status: 'failed'
-              }));
-              break;
-
-            case 'complete':
-              setFinalResult(message.data);
-              setProgress(prevProgress => ({
-                ...prevProgress!,
-                status: 'completed',
-                overall_progress: 100
-              }));
-              console.log('Pipeline completed:', message.data);
-              break;
-
-            default:
-              console.log('Unknown message type:', message.type);
+                  return prevProgress;
+                });
+                break;
+
+              case 'error':
+                setError(message.data.error || 'Unknown error occurred');
+                setProgress(prevProgress => ({
+                  ...prevProgress!,
+                  status: 'failed'
+                }));
+                break;
+
+              case 'heartbeat':
+                break; // Server keepalive, nothing to update
+
+              case 'queued':
+                console.log('Pipeline queued:', message.data.message);
+                break;
+
+              case 'complete':
+                setFinalResult(message.data);
+                setProgress(prevProgress => ({
+                  ...prevProgress!,
+                  status: 'completed',
+                  overall_progress: 100
+                }));
+                console.log('Pipeline completed:', message.data);
+                break;
+
+              default:
+                console.log('Unknown message type:', message.type);
+            }
           }
         } catch (err) {
           console.error('Error parsing WebSocket message:', err);
@@ -146,19 +153,7 @@ const useWebSocket = (): UseWebSocketReturn => {
         setError('Connection error occurred');
       };
 
-      // Send periodic pings to keep connection alive
-      const pingInterval = setInterval(() => {
-        if (wsRef.current?.readyState === WebSocket.OPEN) {
-          wsRef.current.send('ping');
-        } else {
-          clearInterval(pingInterval);
-        }
-      }, 30000); // Ping every 30 seconds
-
-      // Clean up interval when component unmounts
-      return () => {
-        clearInterval(pingInterval);
-      };
+      // No client pings needed: the server sends heartbeats on idle connections
 
     } catch (err) {
       console.error('Error creating WebSocket:', err);
@@ -15,7 +15,7 @@ export class ApiService {
     files: FileList,
     setName?: string,
     setDescription?: string
-  ): Promise<{ session_id: string; message: string; websocket_url: string; files_uploaded: number }> {
+  ): Promise<{ session_id: string; message: string; websocket_url: string; files_uploaded: number; queued: boolean }> {
     const formData = new FormData();
     
     Array.from(files).forEach(file => {
@@ -1,18 +1,29 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
-from solver_verifier.api.pipeline_router import router as pipeline_router
+from solver_verifier.api.pipeline_router import get_pipeline_service, router as pipeline_router
+from solver_verifier.api.responses import ORJSONResponse
+from solver_verifier.api.static_files import CachedStaticFiles
 import logging
 
 # Suppress PDF parsing warnings
 logging.getLogger("pdfminer").setLevel(logging.ERROR)
 logging.getLogger("markitdown").setLevel(logging.ERROR)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close pooled LLM connections, unless the pipeline was never used
+    if get_pipeline_service.cache_info().currsize:
+        await get_pipeline_service().aclose()
+
 app = FastAPI(
     title="RFP Business Requirements Extractor",
     description="A 6-stage Analyzer-Verifier pipeline for extracting business requirements from RFP documents",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -30,8 +41,9 @@ app.include_router(pipeline_router)
 # Serve static files (React frontend)
 frontend_dist = Path("frontend/build")
 if frontend_dist.exists():
-    app.mount("/static", StaticFiles(directory=str(frontend_dist / "static")), name="static")
-    app.mount("/", StaticFiles(directory=str(frontend_dist), html=True), name="frontend")
+    # Bundle files under static/ are content-hashed, so they can be cached forever
+    app.mount("/static", CachedStaticFiles(directory=str(frontend_dist / "static"), immutable=True), name="static")
+    app.mount("/", CachedStaticFiles(directory=str(frontend_dist), html=True), name="frontend")
 
 @app.get("/api")
 async def api_root():
@@ -53,5 +65,17 @@ async def health():
     return {"status": "healthy", "service": "rfp-requirement-extractor"}
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+
+    # Auto-reload runs the app under a file watcher and is meant for development
+    # only; enable it with UVICORN_RELOAD=true. "auto" picks uvloop and httptools
+    # whenever they are installed and falls back to asyncio/h11 otherwise.
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("UVICORN_HOST", "0.0.0.0"),
+        port=int(os.getenv("UVICORN_PORT", "8000")),
+        reload=os.getenv("UVICORN_RELOAD", "false").lower() == "true",
+        loop="auto",
+        http="auto"
+    )
@@ -1,93 +1,245 @@
 """FastAPI router for pipeline operations."""
 
-from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends, WebSocket, WebSocketDisconnect, BackgroundTasks
-from fastapi.responses import JSONResponse
-import tempfile
-import os
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Form, Depends, Request, WebSocket, WebSocketDisconnect, BackgroundTasks
+from fastapi.responses import Response
+import asyncio
+import hashlib
+import logging
 import uuid
-from pathlib import Path
 
+import orjson
+
+from .upload_parser import StreamingUploadParser, UploadRejected
 from ..models.business_requirement import RequirementSet
 from ..models.agent_config import SystemSettings
+from ..models.progress import ProgressUpdate
 from ..services.pipeline_service import PipelineService
 from ..services.prompt_loader import PromptLoader
-from ..services.websocket_manager import websocket_manager
+from ..services.websocket_manager import progress_sender, websocket_manager
+
 
+logger = logging.getLogger(__name__)
 
 # Router for pipeline endpoints
 router = APIRouter(prefix="/pipeline", tags=["pipeline"])
 
-# Global settings instance (would be properly configured in real app)
-settings = SystemSettings()
-pipeline_service = PipelineService(settings)
-prompt_loader = PromptLoader()
+# Uploads are parsed from the raw request stream, so describe the multipart
+# body for the OpenAPI docs explicitly
+UPLOAD_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["files"],
+                    "properties": {
+                        "files": {
+                            "type": "array",
+                            "items": {"type": "string", "format": "binary"},
+                            "description": "RFP documents to process"
+                        },
+                        "set_name": {"type": "string", "description": "Name for the requirement set"},
+                        "set_description": {"type": "string", "description": "Description for the requirement set"}
+                    }
+                }
+            }
+        }
+    }
+}
+
+# Seconds of client silence before the server sends a heartbeat frame
+WEBSOCKET_HEARTBEAT_INTERVAL = 30
+HEARTBEAT_MESSAGE = '{"type": "heartbeat"}'
+
+# Static description of the pipeline stages served by /stages
+PIPELINE_STAGES = [
+    {
+        "stage": 1,
+        "name": "Initial BR Draft Generation",
+        "description": "Extract BR candidates with direct citations and location info",
+        "performer": "Analyzer"
+    },
+    {
+        "stage": 2,
+        "name": "Self-improvement Pass",
+        "description": "Search for missing, ambiguous, or duplicate requirements",
+        "performer": "Analyzer"
+    },
+    {
+        "stage": 3,
+        "name": "Verifier Verification & Bug Report",
+        "description": "Verify traceability, semantic consistency, atomicity, and schema compliance",
+        "performer": "Verifier"
+    },
+    {
+        "stage": 4,
+        "name": "Bug Report Review (Optional)",
+        "description": "Optional human or AI review of verification results",
+        "performer": "Human/AI Reviewer"
+    },
+    {
+        "stage": 5,
+        "name": "Bug Report-based Improvement",
+        "description": "Fix issues identified by verifier",
+        "performer": "Analyzer"
+    },
+    {
+        "stage": 6,
+        "name": "Accept/Reject Decision",
+        "description": "Final decision based on verification results",
+        "performer": "System"
+    }
+]
+
+# Serialized /process results keyed by upload content and configuration, so
+# re-submitting the same documents skips the whole LLM pipeline
+RESULT_CACHE_SIZE = 64
+_result_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+# Shared instances are built lazily on first use rather than at import time.
+# lru_cache makes every request see the same objects, so the configure
+# endpoints below mutate the settings the pipeline actually runs with.
+@lru_cache
+def get_settings() -> SystemSettings:
+    """Get the shared system settings."""
+    return SystemSettings()
 
 
-@router.post("/process", response_model=RequirementSet)
+@lru_cache
+def get_pipeline_service() -> PipelineService:
+    """Get the shared pipeline service."""
+    return PipelineService(get_settings())
+
+
+@lru_cache
+def get_supported_formats() -> frozenset:
+    """Get the accepted upload extensions, computed once for O(1) lookups."""
+    return frozenset(get_pipeline_service().get_supported_formats())
+
+
+@lru_cache
+def get_pipeline_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore capping concurrent background pipeline runs."""
+    return asyncio.Semaphore(get_settings().batch_size)
+
+
+@lru_cache
+def get_prompt_loader() -> PromptLoader:
+    """Get the shared prompt loader."""
+    return PromptLoader()
+
+
+async def _ingest_uploads(
+    request: Request,
+    allowed_extensions: frozenset,
+    settings: SystemSettings
+) -> Tuple[List[Tuple[str, BinaryIO]], Dict[str, str], str]:
+    """
+    Validate and collect all uploaded files in a single pass over the request body.
+    
+    Uploads are kept in memory up to settings.upload_inline_threshold bytes
+    and spill to temporary files (in settings.upload_tmpfs, if set) beyond that.
+    
+    Returns:
+        Tuple of ((filename, file object) pairs, form fields, content hash of
+        the uploaded files). Files already collected are discarded again if
+        any part of the upload is rejected.
+    """
+    parser = StreamingUploadParser(
+        request.headers.get("content-type", ""),
+        allowed_extensions,
+        settings.upload_inline_threshold,
+        settings.upload_tmpfs or None
+    )
+    try:
+        documents, form = await parser.parse(request.stream())
+    except UploadRejected as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if not documents:
+        raise HTTPException(status_code=400, detail="No files provided")
+    
+    return documents, form, parser.content_hash
+
+
+def _result_cache_key(content_hash: str, form: Dict[str, str], settings: SystemSettings) -> str:
+    """Build the result cache key from the uploads, form fields and settings."""
+    key = hashlib.blake2b(digest_size=16)
+    for part in (
+        content_hash,
+        form.get("set_name") or "",
+        form.get("set_description") or "",
+        settings.model_dump_json()
+    ):
+        key.update(part.encode())
+        key.update(b"\0")
+    return key.hexdigest()
+
+
+def _close_documents(documents: List[Tuple[str, BinaryIO]]):
+    """Close uploaded files; any data spilled to disk is removed on close."""
+    for _, file in documents:
+        file.close()
+
+
+@router.post("/process", response_model=RequirementSet, openapi_extra=UPLOAD_REQUEST_BODY)
 async def process_rfp_documents(
-    files: List[UploadFile] = File(..., description="RFP documents to process"),
-    set_name: Optional[str] = Form(None, description="Name for the requirement set"),
-    set_description: Optional[str] = Form(None, description="Description for the requirement set")
+    request: Request,
+    settings: SystemSettings = Depends(get_settings),
+    pipeline_service: PipelineService = Depends(get_pipeline_service),
+    supported_formats: frozenset = Depends(get_supported_formats)
 ):
     """
     Process RFP documents through the 6-stage pipeline.
     
     Uploads multiple files and processes them to extract business requirements
-    using the Analyzer-Verifier pipeline.
+    using the Analyzer-Verifier pipeline. Identical uploads processed with the
+    same configuration are answered from a result cache.
     """
     
-    # Validate file uploads
-    if not files:
-        raise HTTPException(status_code=400, detail="No files provided")
-    
-    # Validate file formats
-    supported_formats = pipeline_service.get_supported_formats()
-    for file in files:
-        if file.filename:
-            file_ext = Path(file.filename).suffix.lower()
-            if file_ext not in supported_formats:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Unsupported file format: {file_ext}. Supported: {', '.join(supported_formats)}"
-                )
+    documents, form, content_hash = await _ingest_uploads(request, supported_formats, settings)
     
-    # Save uploaded files to temporary location
-    temp_files = []
     try:
-        for file in files:
-            if not file.filename:
-                raise HTTPException(status_code=400, detail="Invalid file")
-            
-            # Create temporary file with original extension
-            suffix = Path(file.filename).suffix
-            with tempfile.NamedTemporaryFile(mode='wb', suffix=suffix, delete=False) as temp_file:
-                content = await file.read()
-                temp_file.write(content)
-                temp_files.append(temp_file.name)
+        cache_key = _result_cache_key(content_hash, form, settings)
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            _result_cache.move_to_end(cache_key)
+            return Response(content=cached, media_type="application/json")
         
         # Process documents through pipeline
         result = await pipeline_service.process_rfp_documents(
-            document_paths=temp_files,
-            set_name=set_name,
-            set_description=set_description
+            document_sources=documents,
+            set_name=form.get("set_name") or None,
+            set_description=form.get("set_description") or None
         )
         
-        return result
+        # The result comes straight from our own pipeline, so serialize it
+        # directly instead of letting response_model validate it again
+        # (response_model is kept for the OpenAPI schema)
+        content = result.model_dump_json()
+        
+        # Failed runs are not cached so they can be retried
+        if result.status != "error":
+            _result_cache[cache_key] = content
+            if len(_result_cache) > RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
         
+        return Response(content=content, media_type="application/json")
+        
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        error_detail = f"Processing error: {str(e)}\nTraceback: {traceback.format_exc()}"
-        print(f"❌ Pipeline processing error: {error_detail}")  # Add console logging
+        logger.exception("Pipeline processing failed")
         raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
     
     finally:
-        # Clean up temporary files
-        for temp_file in temp_files:
-            try:
-                os.unlink(temp_file)
-            except:
-                pass  # Ignore cleanup errors
+        # Release uploaded files
+        _close_documents(documents)
 
 
 @router.websocket("/ws/{session_id}")
@@ -96,21 +248,32 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     await websocket_manager.connect(websocket, session_id)
     try:
         while True:
-            # Keep the connection alive
-            data = await websocket.receive_text()
-            # Echo back ping messages to keep connection alive
-            if data == "ping":
+            try:
+                message = await asyncio.wait_for(websocket.receive(), timeout=WEBSOCKET_HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                # Idle connection: send a heartbeat so proxies keep it open.
+                # Dead peers are detected by uvicorn's protocol-level pings.
+                await websocket.send_text(HEARTBEAT_MESSAGE)
+                continue
+            
+            if message["type"] == "websocket.disconnect":
+                break
+            # Answer legacy client pings
+            if message.get("text") == "ping":
                 await websocket.send_text("pong")
     except WebSocketDisconnect:
+        pass
+    finally:
         await websocket_manager.disconnect(websocket, session_id)
 
 
-@router.post("/process-realtime")
+@router.post("/process-realtime", openapi_extra=UPLOAD_REQUEST_BODY)
 async def process_rfp_documents_realtime(
+    request: Request,
     background_tasks: BackgroundTasks,
-    files: List[UploadFile] = File(..., description="RFP documents to process"),
-    set_name: Optional[str] = Form(None, description="Name for the requirement set"),
-    set_description: Optional[str] = Form(None, description="Description for the requirement set")
+    settings: SystemSettings = Depends(get_settings),
+    pipeline_service: PipelineService = Depends(get_pipeline_service),
+    supported_formats: frozenset = Depends(get_supported_formats)
 ):
     """
     Process RFP documents with real-time progress updates via WebSocket.
@@ -119,86 +282,69 @@ async def process_rfp_documents_realtime(
     Connect to WebSocket at /pipeline/ws/{session_id} to receive real-time updates.
     """
     
-    # Validate file uploads
-    if not files:
-        raise HTTPException(status_code=400, detail="No files provided")
-    
-    # Validate file formats
-    supported_formats = pipeline_service.get_supported_formats()
-    for file in files:
-        if file.filename:
-            file_ext = Path(file.filename).suffix.lower()
-            if file_ext not in supported_formats:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Unsupported file format: {file_ext}. Supported: {', '.join(supported_formats)}"
-                )
+    documents, form, _ = await _ingest_uploads(request, supported_formats, settings)
     
     # Generate unique session ID
     session_id = str(uuid.uuid4())
     
-    # Save uploaded files to temporary location
-    temp_files = []
     try:
-        for file in files:
-            if not file.filename:
-                raise HTTPException(status_code=400, detail="Invalid file")
-            
-            # Create temporary file with original extension
-            suffix = Path(file.filename).suffix
-            with tempfile.NamedTemporaryFile(mode='wb', suffix=suffix, delete=False) as temp_file:
-                content = await file.read()
-                temp_file.write(content)
-                temp_files.append(temp_file.name)
-        
         # Start background processing
         background_tasks.add_task(
             _process_documents_background,
-            temp_files,
+            pipeline_service,
+            documents,
             session_id,
-            set_name,
-            set_description
+            form.get("set_name") or None,
+            form.get("set_description") or None
         )
         
-        return JSONResponse(content={
+        # The websocket is usually not connected yet, so report here whether
+        # the run has to wait for a free pipeline slot
+        queued = get_pipeline_semaphore().locked()
+        
+        return {
             "session_id": session_id,
             "message": "Processing started. Connect to WebSocket for real-time updates.",
             "websocket_url": f"/pipeline/ws/{session_id}",
-            "files_uploaded": len(temp_files)
-        })
+            "files_uploaded": len(documents),
+            "queued": queued
+        }
         
     except Exception as e:
-        # Clean up temporary files on error
-        for temp_file in temp_files:
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
+        # Release uploaded files on error
+        _close_documents(documents)
         raise HTTPException(status_code=500, detail=f"Upload error: {str(e)}")
 
 
 async def _process_documents_background(
-    temp_files: List[str],
+    pipeline_service: PipelineService,
+    documents: List[Tuple[str, BinaryIO]],
     session_id: str,
     set_name: Optional[str],
     set_description: Optional[str]
 ):
     """Background task to process documents with progress updates."""
+    semaphore = get_pipeline_semaphore()
     try:
-        # Process documents through pipeline
-        result = await pipeline_service.process_rfp_documents_with_progress(
-            document_paths=temp_files,
-            session_id=session_id,
-            set_name=set_name,
-            set_description=set_description
-        )
+        # Runs beyond the concurrency cap wait here instead of all competing
+        # for the LLM API at once
+        if semaphore.locked():
+            progress_sender.enqueue(session_id, ProgressUpdate.create_queued(session_id))
         
-        print(f"✅ Background processing completed for session: {session_id}")
+        async with semaphore:
+            # Process documents through pipeline
+            result = await pipeline_service.process_rfp_documents_with_progress(
+                document_sources=documents,
+                session_id=session_id,
+                set_name=set_name,
+                set_description=set_description
+            )
+        
+        logger.info("Background processing completed for session %s", session_id)
         
     except Exception as e:
-        print(f"❌ Background processing failed for session {session_id}: {str(e)}")
+        logger.exception("Background processing failed for session %s", session_id)
         # Send error to WebSocket if still connected
-        from ..models.progress import ProgressUpdate
         from datetime import datetime
         error_update = ProgressUpdate(
             type="error",
@@ -206,30 +352,30 @@ async def _process_documents_background(
             timestamp=datetime.now(),
             data={"error": str(e), "details": "Background processing failed"}
         )
-        await websocket_manager.send_update(session_id, error_update)
+        progress_sender.enqueue(session_id, error_update)
     
     finally:
-        # Clean up temporary files
-        for temp_file in temp_files:
-            try:
-                os.unlink(temp_file)
-            except:
-                pass  # Ignore cleanup errors
+        # Release uploaded files
+        _close_documents(documents)
 
 
 @router.get("/status/{set_id}")
-async def get_pipeline_status(set_id: str):
+async def get_pipeline_status(
+    set_id: str,
+    pipeline_service: PipelineService = Depends(get_pipeline_service)
+):
     """Get the current status of a pipeline processing job."""
     try:
         status = await pipeline_service.get_pipeline_status(set_id)
-        return JSONResponse(content=status)
+        return status
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Set not found: {str(e)}")
 
 
 @router.post("/configure/analyzer")
 async def configure_analyzer_prompt(
-    system_prompt: str = Form(..., description="System prompt for the Analyzer agent")
+    system_prompt: str = Form(..., description="System prompt for the Analyzer agent"),
+    settings: SystemSettings = Depends(get_settings)
 ):
     """
     Configure the system prompt for the Analyzer agent.
@@ -239,17 +385,19 @@ async def configure_analyzer_prompt(
     """
     try:
         settings.analyzer_system_prompt = system_prompt
-        return JSONResponse(content={
+        _result_cache.clear()
+        return {
             "message": "Analyzer system prompt updated successfully",
             "prompt_length": len(system_prompt)
-        })
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Configuration error: {str(e)}")
 
 
 @router.post("/configure/verifier")
 async def configure_verifier_prompt(
-    system_prompt: str = Form(..., description="System prompt for the Verifier agent")
+    system_prompt: str = Form(..., description="System prompt for the Verifier agent"),
+    settings: SystemSettings = Depends(get_settings)
 ):
     """
     Configure the system prompt for the Verifier agent.
@@ -259,20 +407,21 @@ async def configure_verifier_prompt(
     """
     try:
         settings.verifier_system_prompt = system_prompt
-        return JSONResponse(content={
+        _result_cache.clear()
+        return {
             "message": "Verifier system prompt updated successfully",
             "prompt_length": len(system_prompt)
-        })
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Configuration error: {str(e)}")
 
 
 @router.get("/configure")
-async def get_current_configuration():
+async def get_current_configuration(settings: SystemSettings = Depends(get_settings)):
     """
     Get the current configuration for both Analyzer and Verifier agents.
     """
-    return JSONResponse(content={
+    return {
         "analyzer_prompt_configured": bool(settings.analyzer_system_prompt),
         "verifier_prompt_configured": bool(settings.verifier_system_prompt),
         "analyzer_prompt_length": len(settings.analyzer_system_prompt),
@@ -282,14 +431,15 @@ async def get_current_configuration():
             "acceptance_threshold": settings.pipeline_config.acceptance_threshold,
             "enable_stage_4_review": settings.pipeline_config.enable_stage_4_review
         }
-    })
+    }
 
 
 @router.post("/configure/pipeline")
 async def configure_pipeline_settings(
     max_iterations: Optional[int] = Form(None, description="Maximum iterations for verification loop", ge=1, le=10),
     acceptance_threshold: Optional[int] = Form(None, description="Consecutive passes needed for acceptance", ge=1, le=5),
-    enable_stage_4_review: Optional[bool] = Form(None, description="Enable optional human review in stage 4")
+    enable_stage_4_review: Optional[bool] = Form(None, description="Enable optional human review in stage 4"),
+    settings: SystemSettings = Depends(get_settings)
 ):
     """
     Configure pipeline processing settings.
@@ -301,108 +451,90 @@ async def configure_pipeline_settings(
             settings.pipeline_config.acceptance_threshold = acceptance_threshold
         if enable_stage_4_review is not None:
             settings.pipeline_config.enable_stage_4_review = enable_stage_4_review
+        _result_cache.clear()
         
-        return JSONResponse(content={
+        return {
             "message": "Pipeline configuration updated successfully",
             "current_config": {
                 "max_iterations": settings.pipeline_config.max_iterations,
                 "acceptance_threshold": settings.pipeline_config.acceptance_threshold,
                 "enable_stage_4_review": settings.pipeline_config.enable_stage_4_review
             }
-        })
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Configuration error: {str(e)}")
 
 
+@lru_cache(maxsize=4)
+def _stages_payload(supported_formats: Tuple[str, ...]) -> bytes:
+    """Serialize the /stages response once per set of supported formats."""
+    return orjson.dumps({
+        "stages": PIPELINE_STAGES,
+        "verification_loop": "Stages 3-5 repeat until acceptance criteria met or max iterations reached",
+        "supported_formats": list(supported_formats)
+    })
+
+
 @router.get("/stages")
-async def get_pipeline_stages():
+async def get_pipeline_stages(pipeline_service: PipelineService = Depends(get_pipeline_service)):
     """
     Get information about the 6 pipeline stages.
     """
-    return JSONResponse(content={
-        "stages": [
-            {
-                "stage": 1,
-                "name": "Initial BR Draft Generation",
-                "description": "Extract BR candidates with direct citations and location info",
-                "performer": "Analyzer"
-            },
-            {
-                "stage": 2,
-                "name": "Self-improvement Pass",
-                "description": "Search for missing, ambiguous, or duplicate requirements",
-                "performer": "Analyzer"
-            },
-            {
-                "stage": 3,
-                "name": "Verifier Verification & Bug Report",
-                "description": "Verify traceability, semantic consistency, atomicity, and schema compliance",
-                "performer": "Verifier"
-            },
-            {
-                "stage": 4,
-                "name": "Bug Report Review (Optional)",
-                "description": "Optional human or AI review of verification results",
-                "performer": "Human/AI Reviewer"
-            },
-            {
-                "stage": 5,
-                "name": "Bug Report-based Improvement",
-                "description": "Fix issues identified by verifier",
-                "performer": "Analyzer"
-            },
-            {
-                "stage": 6,
-                "name": "Accept/Reject Decision",
-                "description": "Final decision based on verification results",
-                "performer": "System"
-            }
-        ],
-        "verification_loop": "Stages 3-5 repeat until acceptance criteria met or max iterations reached",
-        "supported_formats": pipeline_service.get_supported_formats()
-    })
+    return Response(
+        content=_stages_payload(tuple(pipeline_service.get_supported_formats())),
+        media_type="application/json"
+    )
 
 
 @router.post("/prompts/load")
-async def load_prompts_from_files():
+async def load_prompts_from_files(
+    settings: SystemSettings = Depends(get_settings),
+    prompt_loader: PromptLoader = Depends(get_prompt_loader)
+):
     """
     Load system prompts from files in the prompts/ directory.
     """
     try:
-        analyzer_prompt = prompt_loader.load_analyzer_prompt()
-        verifier_prompt = prompt_loader.load_verifier_prompt()
+        analyzer_prompt, verifier_prompt = await asyncio.gather(
+            prompt_loader.aload_analyzer_prompt(),
+            prompt_loader.aload_verifier_prompt()
+        )
         
         if analyzer_prompt:
             settings.analyzer_system_prompt = analyzer_prompt
         if verifier_prompt:
             settings.verifier_system_prompt = verifier_prompt
+        _result_cache.clear()
             
-        return JSONResponse(content={
+        return {
             "message": "Prompts loaded from files",
             "analyzer_loaded": bool(analyzer_prompt),
             "verifier_loaded": bool(verifier_prompt),
             "analyzer_length": len(analyzer_prompt) if analyzer_prompt else 0,
             "verifier_length": len(verifier_prompt) if verifier_prompt else 0
-        })
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading prompts: {str(e)}")
 
 
 @router.post("/prompts/save")
-async def save_current_prompts():
+async def save_current_prompts(
+    settings: SystemSettings = Depends(get_settings),
+    prompt_loader: PromptLoader = Depends(get_prompt_loader)
+):
     """
     Save current system prompts to files.
     """
     try:
         if settings.analyzer_system_prompt:
-            prompt_loader.save_analyzer_prompt(settings.analyzer_system_prompt)
+            await prompt_loader.asave_analyzer_prompt(settings.analyzer_system_prompt)
         if settings.verifier_system_prompt:
-            prompt_loader.save_verifier_prompt(settings.verifier_system_prompt)
+            await prompt_loader.asave_verifier_prompt(settings.verifier_system_prompt)
             
-        return JSONResponse(content={
+        return {
             "message": "Prompts saved to files",
             "analyzer_saved": bool(settings.analyzer_system_prompt),
             "verifier_saved": bool(settings.verifier_system_prompt)
-        })
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving prompts: {str(e)}")
\ No newline at end of file
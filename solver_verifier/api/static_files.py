@@ -0,0 +1,86 @@
+"""Static file serving for the built React frontend."""
+
+import mimetypes
+import os
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Scope
+
+
+# Cache policy for content-hashed bundle files, whose names change on every build
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Everything else (index.html, manifest, ...) must be revalidated
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Precompressed variants looked up next to each file, in order of preference
+PRECOMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles with explicit caching headers and precompressed variants.
+
+    Mounts created with ``immutable=True`` mark every file as cacheable for a
+    year, which is only safe for content-hashed build output. When a
+    ``<file>.br`` or ``<file>.gz`` exists and the client accepts that
+    encoding, it is served instead of compressing anything per request.
+    """
+
+    def __init__(self, *args, immutable: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+
+        response = self._precompressed_response(full_path, request_headers, status_code)
+        if response is None:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        response.headers["Cache-Control"] = self.cache_control
+        response.headers["Vary"] = "Accept-Encoding"
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _precompressed_response(
+        self,
+        full_path: PathLike,
+        request_headers: Headers,
+        status_code: int
+    ) -> Optional[FileResponse]:
+        """Return a response for a precompressed variant the client accepts, if any."""
+        accepted = set()
+        for entry in request_headers.get("accept-encoding", "").split(","):
+            encoding, _, params = entry.partition(";")
+            if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                accepted.add(encoding.strip())
+
+        for encoding, suffix in PRECOMPRESSED_VARIANTS:
+            if encoding not in accepted:
+                continue
+            variant_path = f"{full_path}{suffix}"
+            try:
+                variant_stat = os.stat(variant_path)
+            except OSError:
+                continue
+
+            media_type, _ = mimetypes.guess_type(str(full_path))
+            return FileResponse(
+                variant_path,
+                status_code=status_code,
+                stat_result=variant_stat,
+                media_type=media_type or "text/plain",
+                headers={"Content-Encoding": encoding}
+            )
+
+        return None
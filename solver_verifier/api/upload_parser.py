@@ -0,0 +1,238 @@
+"""Streaming multipart parser that keeps uploaded files in memory when they fit."""
+
+import asyncio
+import hashlib
+import io
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Dict, List, Optional, Set, Tuple
+
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+
+# Maximum size of a non-file form field (set_name, set_description, ...)
+MAX_FIELD_SIZE = 1 << 20
+
+# File data is buffered and written in batches of this size, so each upload
+# costs a handful of large writes rather than one small write per body chunk
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=8)
+def supported_formats_str(allowed_extensions: frozenset) -> str:
+    """Human-readable list of allowed extensions, joined once per set."""
+    return ', '.join(sorted(allowed_extensions))
+
+
+class UploadRejected(Exception):
+    """Raised when an uploaded part fails validation."""
+
+
+class _Part:
+    """State for the multipart part currently being parsed."""
+
+    def __init__(self):
+        self.headers: Dict[bytes, bytes] = {}
+        self.field_name: str = ""
+        self.filename: Optional[str] = None
+        self.file: Optional[BinaryIO] = None
+        self.spilled = False
+        self.ended = False
+        self.size = 0
+        self.buffer = bytearray()
+        self.data = bytearray()
+
+
+class StreamingUploadParser:
+    """
+    Parse a multipart/form-data request body incrementally.
+
+    File parts are validated as soon as their headers arrive and their bytes
+    are collected while the body is still being received. Uploads stay in
+    memory until their combined size exceeds ``inline_threshold``; past that,
+    files spill to anonymous temporary files in ``spill_dir`` (the system temp
+    directory by default). On Linux these are O_TMPFILE inodes with no
+    directory entry, so they vanish on close and cannot leak after a crash.
+    """
+
+    def __init__(
+        self,
+        content_type: str,
+        allowed_extensions: frozenset,
+        inline_threshold: int,
+        spill_dir: Optional[str] = None
+    ):
+        self.content_type = content_type
+        self.allowed_extensions = allowed_extensions
+        self.inline_threshold = inline_threshold
+        self.spill_dir = spill_dir
+        self.documents: List[Tuple[str, BinaryIO]] = []
+        self.fields: Dict[str, str] = {}
+        # Digest of every uploaded file (content and extension, in order),
+        # computed as the bytes stream past
+        self.content_hash = ""
+        self._digest = hashlib.blake2b(digest_size=16)
+        self._filenames: Set[str] = set()
+        self._in_memory = 0
+        self._part = _Part()
+        self._header_name = b""
+        self._header_value = b""
+        # File parts touched by the (synchronous) parser callbacks, flushed
+        # asynchronously after each chunk is fed to the parser
+        self._pending: List[_Part] = []
+
+    async def parse(self, stream: AsyncIterator[bytes]) -> Tuple[List[Tuple[str, BinaryIO]], Dict[str, str]]:
+        """
+        Consume the request body stream.
+
+        Returns:
+            Tuple of ((filename, file object) pairs in upload order, form
+            fields). File objects are positioned at their start and must be
+            closed by the caller.
+
+        Raises:
+            UploadRejected: If the body is malformed or a file is not supported
+        """
+        mime_type, params = parse_options_header(self.content_type)
+        if mime_type != b"multipart/form-data" or b"boundary" not in params:
+            raise UploadRejected("Expected a multipart/form-data request")
+
+        parser = MultipartParser(params[b"boundary"], {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        })
+
+        try:
+            async for chunk in stream:
+                parser.write(chunk)
+                await self._flush_pending()
+            parser.finalize()
+            await self._flush_pending()
+        except Exception as e:
+            self.close()
+            if isinstance(e, UploadRejected):
+                raise
+            raise UploadRejected(f"Malformed multipart body: {e}") from e
+
+        self.content_hash = self._digest.hexdigest()
+        return self.documents, self.fields
+
+    def close(self):
+        """Close every uploaded file, discarding any data spilled to disk."""
+        for _, file in self.documents:
+            file.close()
+        self.documents = []
+
+    async def _flush_pending(self):
+        for part in self._pending:
+            if part.ended or len(part.buffer) >= WRITE_BUFFER_SIZE:
+                await self._flush(part)
+        self._pending.clear()
+
+    async def _flush(self, part: _Part):
+        """Move a part's buffered bytes into its file object."""
+        if not part.spilled and self._in_memory + len(part.buffer) > self.inline_threshold:
+            await self._spill(part)
+
+        if part.buffer:
+            if part.spilled:
+                await asyncio.to_thread(part.file.write, part.buffer)
+            else:
+                part.file.write(part.buffer)
+                self._in_memory += len(part.buffer)
+            part.buffer = bytearray()
+
+        if part.ended:
+            part.file.seek(0)
+
+    async def _spill(self, part: _Part):
+        """Move an in-memory upload to a temporary file."""
+        in_memory = part.file
+        part.file = await asyncio.to_thread(tempfile.TemporaryFile, dir=self.spill_dir)
+        part.spilled = True
+        self.documents[self.documents.index((part.filename, in_memory))] = (part.filename, part.file)
+
+        with in_memory.getbuffer() as data:
+            self._in_memory -= len(data)
+            await asyncio.to_thread(part.file.write, data)
+        in_memory.close()
+
+    def _unique_filename(self, filename: str) -> str:
+        """Disambiguate uploads that share a filename ("a.pdf", "a (2).pdf", ...)."""
+        path = Path(filename)
+        unique = path.name
+        counter = 2
+        while unique in self._filenames:
+            unique = f"{path.stem} ({counter}){path.suffix}"
+            counter += 1
+        self._filenames.add(unique)
+        return unique
+
+    def _on_part_begin(self):
+        self._part = _Part()
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        self._part.headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self):
+        part = self._part
+        _, options = parse_options_header(part.headers.get(b"content-disposition", b""))
+        part.field_name = options.get(b"name", b"").decode("utf-8", errors="replace")
+        if b"filename" not in options:
+            return
+
+        filename = options[b"filename"].decode("utf-8", errors="replace")
+        if not filename:
+            raise UploadRejected("Invalid file")
+
+        # Reject unsupported formats before any of their bytes are stored
+        suffix = Path(filename).suffix
+        if suffix.lower() not in self.allowed_extensions:
+            raise UploadRejected(
+                f"Unsupported file format: {suffix.lower()}. "
+                f"Supported: {supported_formats_str(self.allowed_extensions)}"
+            )
+
+        part.filename = self._unique_filename(filename)
+        part.file = io.BytesIO()
+        self.documents.append((part.filename, part.file))
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        part = self._part
+        if part.file is not None:
+            chunk = data[start:end]
+            self._digest.update(chunk)
+            part.size += len(chunk)
+            part.buffer += chunk
+            if not self._pending or self._pending[-1] is not part:
+                self._pending.append(part)
+        elif part.filename is None:
+            if len(part.data) + end - start > MAX_FIELD_SIZE:
+                raise UploadRejected(f"Form field '{part.field_name}' is too large")
+            part.data += data[start:end]
+
+    def _on_part_end(self):
+        part = self._part
+        if part.file is not None:
+            # Terminate each file in the digest so [a, bc] and [ab, c] differ
+            suffix = Path(part.filename).suffix.lower().encode()
+            self._digest.update(suffix + len(suffix).to_bytes(2, "little") + part.size.to_bytes(8, "little"))
+            part.ended = True
+            if not self._pending or self._pending[-1] is not part:
+                self._pending.append(part)
+        elif part.filename is None:
+            self.fields[part.field_name] = part.data.decode("utf-8", errors="replace")
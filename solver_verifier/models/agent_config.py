@@ -1,11 +1,38 @@
 """Configuration models for Analyzer and Verifier agents."""
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 
 
+# Default timeout in seconds for each pipeline stage
+DEFAULT_STAGE_TIMEOUTS: Dict[int, int] = {1: 300, 2: 240, 3: 180, 4: 120, 5: 240, 6: 60}
+
+
+@lru_cache(maxsize=8)
+def _read_prompt_file(resolved_path: str, mtime_ns: int) -> str:
+    """Read a prompt file and strip comment lines (cached per path and mtime)."""
+    with open(resolved_path, 'r', encoding='utf-8') as f:
+        content = f.read().strip()
+    # Remove comment lines starting with #
+    lines = [line for line in content.split('\n')
+             if not line.strip().startswith('#')]
+    return '\n'.join(lines).strip()
+
+
+def load_prompt_file(file_path: str) -> str:
+    """Load prompt from file, removing comment lines."""
+    try:
+        prompt_file = Path(file_path).resolve()
+        if prompt_file.exists():
+            return _read_prompt_file(str(prompt_file), prompt_file.stat().st_mtime_ns)
+    except Exception as e:
+        print(f"Warning: Could not load prompt from {file_path}: {e}")
+    return ""
+
+
 class AgentPromptConfig(BaseModel):
     """Configuration for agent system prompts."""
     role: str = Field(..., description="Agent role (analyzer or verifier)")
@@ -21,8 +48,12 @@ class PipelineConfig(BaseModel):
     max_iterations: int = Field(default=5, ge=1, le=10, description="Maximum iterations for stages 3-5")
     acceptance_threshold: int = Field(default=3, ge=1, le=5, description="Consecutive passes needed for acceptance")
     enable_stage_4_review: bool = Field(default=False, description="Enable optional human/AI review in stage 4")
+    skip_clean_self_improvement: bool = Field(
+        default=False,
+        description="Skip the stage 2 LLM pass when local checks find nothing to fix in the draft"
+    )
     stage_timeouts: Dict[int, int] = Field(
-        default_factory=lambda: {1: 300, 2: 240, 3: 180, 4: 120, 5: 240, 6: 60},
+        default_factory=DEFAULT_STAGE_TIMEOUTS.copy,
         description="Timeout in seconds for each stage"
     )
 
@@ -30,6 +61,15 @@ class PipelineConfig(BaseModel):
 class SystemSettings(BaseSettings):
     """Application-wide settings."""
     
+    # Unrelated variables in .env (e.g. UVICORN_*) are ignored, and nested
+    # pipeline settings use PIPELINE_CONFIG__<FIELD> as in .env.example
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_nested_delimiter="__",
+        extra="ignore"
+    )
+    
     # OpenAI Configuration
     openai_api_key: str = Field(
         default="",
@@ -69,38 +109,53 @@ class SystemSettings(BaseSettings):
     def model_post_init(self, __context):
         """Auto-load prompts from files if not set via environment."""
         if not self.analyzer_system_prompt:
-            self.analyzer_system_prompt = self._load_prompt_file("prompts/analyzer_prompt.txt")
+            self.analyzer_system_prompt = load_prompt_file("prompts/analyzer_prompt.txt")
         
         if not self.verifier_system_prompt:
-            self.verifier_system_prompt = self._load_prompt_file("prompts/verifier_prompt.txt")
-    
-    def _load_prompt_file(self, file_path: str) -> str:
-        """Load prompt from file, removing comment lines."""
-        try:
-            prompt_file = Path(file_path)
-            if prompt_file.exists():
-                with open(prompt_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    # Remove comment lines starting with #
-                    lines = [line for line in content.split('\n') 
-                            if not line.strip().startswith('#')]
-                    return '\n'.join(lines).strip()
-        except Exception as e:
-            print(f"Warning: Could not load prompt from {file_path}: {e}")
-        return ""
+            self.verifier_system_prompt = load_prompt_file("prompts/verifier_prompt.txt")
     
     # Pipeline settings
     pipeline_config: PipelineConfig = Field(default_factory=PipelineConfig)
     
     # Storage settings
     output_directory: str = Field(default="./output", description="Directory for output files")
+    llm_cache_dir: str = Field(
+        default="",
+        description="Directory for caching LLM responses by request hash, e.g. ~/.cache/solver_verifier (disabled when empty)"
+    )
+    llm_cache_ttl: int = Field(
+        default=0,
+        ge=0,
+        description="Seconds before a cached LLM response expires (0 = never)"
+    )
     enable_logging: bool = Field(default=True, description="Enable detailed logging")
     log_level: str = Field(default="INFO", description="Logging level")
     
     # Performance settings
     concurrent_processing: bool = Field(default=False, description="Enable concurrent processing where possible")
     batch_size: int = Field(default=10, ge=1, le=100, description="Batch size for processing")
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
\ No newline at end of file
+    max_concurrent_llm_calls: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum LLM requests a pipeline stage issues concurrently"
+    )
+    llm_requests_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Requests per minute allowed by the OpenAI account (0 disables throttling)"
+    )
+    llm_tokens_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Tokens per minute allowed by the OpenAI account (0 disables throttling)"
+    )
+    upload_inline_threshold: int = Field(
+        default=32 * 1024 * 1024,
+        ge=0,
+        description="Total upload size in bytes kept in memory before files spill to disk"
+    )
+    upload_tmpfs: str = Field(
+        default="",
+        description="Directory for uploads that spill out of memory, e.g. a tmpfs such as /dev/shm (default: system temp dir)"
+    )
\ No newline at end of file
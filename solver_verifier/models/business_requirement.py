@@ -2,8 +2,9 @@
 
 from datetime import datetime
 from enum import Enum
+from sys import intern
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class RequirementType(str, Enum):
@@ -32,82 +33,95 @@ class ErrorType(str, Enum):
 
 class SourceLocation(BaseModel):
     """Location information for requirement source."""
-    document: str = Field(..., description="Source document name/path")
-    section: Optional[str] = Field(None, description="Section or page reference")
-    line_number: Optional[int] = Field(None, description="Line number if applicable")
-    page_number: Optional[int] = Field(None, description="Page number if applicable")
-    paragraph: Optional[str] = Field(None, description="Paragraph identifier")
+    document: str  # Source document name/path
+    section: Optional[str] = None  # Section or page reference
+    line_number: Optional[int] = None
+    page_number: Optional[int] = None
+    paragraph: Optional[str] = None
+    
+    # Every citation of a document repeats its name; share one string object
+    @field_validator("document")
+    @classmethod
+    def _intern_document(cls, v: str) -> str:
+        return intern(v)
 
 
 class Citation(BaseModel):
     """Direct citation from source document."""
-    text: str = Field(..., description="Exact quoted text from source")
-    location: SourceLocation = Field(..., description="Location of the citation")
-    context: Optional[str] = Field(None, description="Surrounding context")
+    text: str  # Exact quoted text from source
+    location: SourceLocation
+    context: Optional[str] = None  # Surrounding context
 
 
 class AcceptanceCriteria(BaseModel):
     """Acceptance criteria for a requirement."""
-    criterion_id: str = Field(..., description="Unique identifier for the criterion")
-    description: str = Field(..., description="Description of the acceptance criterion")
-    testable: bool = Field(True, description="Whether this criterion is testable")
+    criterion_id: str
+    description: str
+    testable: bool = True
 
 
 class BusinessRequirement(BaseModel):
     """Core business requirement model."""
-    br_id: str = Field(..., description="Unique identifier for the business requirement")
-    title: str = Field(..., description="Brief title of the requirement")
-    description: str = Field(..., description="Detailed description of the requirement")
+    br_id: str
+    title: str
+    description: str
     
     # Classification
-    requirement_type: RequirementType = Field(..., description="Type of requirement")
-    priority: Priority = Field(..., description="Priority level")
+    requirement_type: RequirementType
+    priority: Priority
     
     # Traceability
-    citations: List[Citation] = Field(default_factory=list, description="Direct citations from source documents")
+    citations: List[Citation] = Field(default_factory=list)
     
     # Stakeholders and Value
-    stakeholders: List[str] = Field(default_factory=list, description="List of stakeholders")
-    business_value: Optional[str] = Field(None, description="Business value or rationale")
+    stakeholders: List[str] = Field(default_factory=list)
+    business_value: Optional[str] = None  # Business value or rationale
     
     # Acceptance criteria
-    acceptance_criteria: List[AcceptanceCriteria] = Field(default_factory=list, description="Acceptance criteria")
+    acceptance_criteria: List[AcceptanceCriteria] = Field(default_factory=list)
     
     # Metadata
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
-    tags: List[str] = Field(default_factory=list, description="Tags for categorization")
+    tags: List[str] = Field(default_factory=list)
     
     # Dependencies and relationships
-    dependencies: List[str] = Field(default_factory=list, description="IDs of dependent requirements")
-    conflicts: List[str] = Field(default_factory=list, description="IDs of conflicting requirements")
+    dependencies: List[str] = Field(default_factory=list)  # IDs of dependent requirements
+    conflicts: List[str] = Field(default_factory=list)  # IDs of conflicting requirements
     
     # Additional metadata
-    assumptions: List[str] = Field(default_factory=list, description="Assumptions made")
-    constraints: List[str] = Field(default_factory=list, description="Constraints or limitations")
-    notes: Optional[str] = Field(None, description="Additional notes")
+    assumptions: List[str] = Field(default_factory=list)
+    constraints: List[str] = Field(default_factory=list)
+    notes: Optional[str] = None
+    
+    # Stakeholders, tags and requirement IDs recur across many requirements;
+    # share one string object per distinct value
+    @field_validator("stakeholders", "tags", "dependencies", "conflicts")
+    @classmethod
+    def _intern_items(cls, v: List[str]) -> List[str]:
+        return [intern(item) for item in v]
 
 
 class HypothesisRequirement(BaseModel):
     """Requirement hypothesis with insufficient evidence."""
-    hypothesis_id: str = Field(..., description="Unique identifier for the hypothesis")
-    description: str = Field(..., description="Description of the hypothetical requirement")
-    rationale: str = Field(..., description="Reasoning behind the hypothesis")
-    confidence_level: float = Field(..., ge=0.0, le=1.0, description="Confidence level (0-1)")
-    evidence_needed: List[str] = Field(default_factory=list, description="What evidence is needed to confirm")
+    hypothesis_id: str
+    description: str
+    rationale: str  # Reasoning behind the hypothesis
+    confidence_level: float = Field(..., ge=0.0, le=1.0)
+    evidence_needed: List[str] = Field(default_factory=list)  # What evidence is needed to confirm
     created_at: datetime = Field(default_factory=datetime.now)
 
 
 class VerificationIssue(BaseModel):
     """Issue found during verification."""
-    issue_id: str = Field(..., description="Unique identifier for the issue")
-    br_id: str = Field(..., description="ID of the business requirement with issue")
-    error_type: ErrorType = Field(..., description="Type of error")
-    severity: str = Field(..., description="Severity level")
-    description: str = Field(..., description="Description of the issue")
-    location: Optional[str] = Field(None, description="Location where issue was found")
-    citation_issue: Optional[str] = Field(None, description="Issue with citation if applicable")
-    suggested_fix: Optional[str] = Field(None, description="Suggested fix for the issue")
+    issue_id: str
+    br_id: str  # ID of the business requirement with issue
+    error_type: ErrorType
+    severity: str
+    description: str
+    location: Optional[str] = None  # Location where issue was found
+    citation_issue: Optional[str] = None  # Issue with citation if applicable
+    suggested_fix: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.now)
 
 
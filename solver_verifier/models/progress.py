@@ -1,10 +1,13 @@
 """Progress tracking models for pipeline execution."""
 
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from datetime import datetime
 from enum import Enum
 
+import orjson
+
 
 class ProgressStatus(str, Enum):
     """Status of a pipeline step."""
@@ -42,32 +45,42 @@ class PipelineProgress(BaseModel):
     current_iteration: int = 1
     max_iterations: int = 5
     
+    # Position of each step by step_id and running sum of step progress,
+    # kept up to date by update_step
+    _step_index: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _progress_sum: int = PrivateAttr(default=0)
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._step_index = {step.step_id: i for i, step in enumerate(self.steps)}
+        self._progress_sum = sum(step.progress_percent for step in self.steps)
+    
     def update_step(self, step_id: str, status: ProgressStatus, 
                    progress_percent: int = None, message: str = None, 
                    details: Dict[str, Any] = None, error: str = None):
         """Update a specific step's progress."""
-        for step in self.steps:
-            if step.step_id == step_id:
-                step.status = status
-                if progress_percent is not None:
-                    step.progress_percent = progress_percent
-                if message is not None:
-                    step.message = message
-                if details is not None:
-                    step.details = details
-                if error is not None:
-                    step.error = error
-                
-                if status == ProgressStatus.IN_PROGRESS and step.started_at is None:
-                    step.started_at = datetime.now()
-                elif status in [ProgressStatus.COMPLETED, ProgressStatus.FAILED]:
-                    step.completed_at = datetime.now()
-                
-                break
+        now = datetime.now()
+        idx = self._step_index.get(step_id)
+        if idx is not None:
+            step = self.steps[idx]
+            step.status = status
+            if progress_percent is not None:
+                self._progress_sum += progress_percent - step.progress_percent
+                step.progress_percent = progress_percent
+            if message is not None:
+                step.message = message
+            if details is not None:
+                step.details = details
+            if error is not None:
+                step.error = error
+            
+            if status == ProgressStatus.IN_PROGRESS and step.started_at is None:
+                step.started_at = now
+            elif status in [ProgressStatus.COMPLETED, ProgressStatus.FAILED]:
+                step.completed_at = now
         
         # Update overall progress
         self._calculate_overall_progress()
-        self.updated_at = datetime.now()
+        self.updated_at = now
     
     def _calculate_overall_progress(self):
         """Calculate overall progress based on steps."""
@@ -75,27 +88,48 @@ class PipelineProgress(BaseModel):
             self.overall_progress = 0
             return
         
-        total_progress = sum(step.progress_percent for step in self.steps)
-        self.overall_progress = min(100, total_progress // len(self.steps))
+        self.overall_progress = min(100, self._progress_sum // len(self.steps))
         
-        # Update current step
+        # Update current step: the first in-progress step, or the last step
+        # once every step has completed
+        first_in_progress = -1
+        all_completed = True
         for i, step in enumerate(self.steps):
-            if step.status == ProgressStatus.IN_PROGRESS:
-                self.current_step = i + 1
-                break
-        else:
-            if all(step.status == ProgressStatus.COMPLETED for step in self.steps):
-                self.current_step = len(self.steps)
-                self.status = ProgressStatus.COMPLETED
+            if step.status == ProgressStatus.IN_PROGRESS and first_in_progress < 0:
+                first_in_progress = i
+            if step.status != ProgressStatus.COMPLETED:
+                all_completed = False
+        
+        if first_in_progress >= 0:
+            self.current_step = first_in_progress + 1
+        elif all_completed:
+            self.current_step = len(self.steps)
+            self.status = ProgressStatus.COMPLETED
 
 
-class ProgressUpdate(BaseModel):
-    """WebSocket progress update message."""
+@dataclass(slots=True)
+class ProgressUpdate:
+    """
+    WebSocket progress update message.
+    
+    Updates are built from already-validated pipeline state and serialized
+    straight away, so this is a plain slotted dataclass that orjson encodes
+    directly, datetimes and enums in ``data`` included.
+    """
     type: str  # "progress_update", "step_update", "error", "complete"
     session_id: str
     timestamp: datetime
     data: Dict[str, Any]
     
+    def to_json(self) -> str:
+        """Serialize the update as a JSON text frame."""
+        return orjson.dumps(self).decode()
+    
+    @staticmethod
+    def to_json_array(updates: List["ProgressUpdate"]) -> str:
+        """Serialize several updates as one JSON array text frame."""
+        return orjson.dumps(updates).decode()
+    
     @classmethod
     def create_step_update(cls, session_id: str, step: PipelineStep):
         """Create a step update message."""
@@ -139,4 +173,14 @@ class ProgressUpdate(BaseModel):
             session_id=session_id,
             timestamp=datetime.now(),
             data=result
+        )
+    
+    @classmethod
+    def create_queued(cls, session_id: str):
+        """Create a message for a run waiting for a free pipeline slot."""
+        return cls(
+            type="queued",
+            session_id=session_id,
+            timestamp=datetime.now(),
+            data={"message": "Waiting for other pipeline runs to finish"}
         )
\ No newline at end of file
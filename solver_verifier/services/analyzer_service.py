@@ -1,9 +1,16 @@
 """Analyzer service - equivalent to Solver role in Gemini's approach."""
 
-import json
-import uuid
+import asyncio
+import itertools
+import logging
+import re
+from collections import defaultdict
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from secrets import token_hex
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from ..models.business_requirement import (
     BusinessRequirement, 
@@ -12,12 +19,173 @@ from ..models.business_requirement import (
     SourceLocation,
     AcceptanceCriteria,
     VerificationIssue,
+    ErrorType,
     RequirementType,
     Priority
 )
 from ..models.agent_config import SystemSettings
 from .llm_service import LLMService
 
+logger = logging.getLogger(__name__)
+
+
+# IDs generated for items the LLM did not name are "<prefix>_<run id><seq>":
+# the run id is drawn once per process and the sequence counts up, so no
+# random bytes are read per ID
+_RUN_ID = token_hex(3)
+_id_sequence = itertools.count(1)
+
+
+def _generate_id(prefix: str) -> str:
+    """Generate a process-unique ID such as "BR_1a2b3c0001"."""
+    return f"{prefix}_{_RUN_ID}{next(_id_sequence):04d}"
+
+
+# Classification used when the LLM response does not specify one
+DEFAULT_REQUIREMENT_TYPE = RequirementType.FUNCTIONAL
+DEFAULT_PRIORITY = Priority.MEDIUM
+
+# Keywords in the LLM's priority field (English or Korean) and the priority
+# each maps to; anything unmatched falls back to DEFAULT_PRIORITY
+PRIORITY_KEYWORDS = {
+    "high": Priority.HIGH,
+    "높음": Priority.HIGH,
+    "low": Priority.LOW,
+    "낮음": Priority.LOW,
+    "critical": Priority.CRITICAL,
+    "중요": Priority.CRITICAL,
+}
+PRIORITY_PATTERN = re.compile("|".join(map(re.escape, PRIORITY_KEYWORDS)))
+
+# Order in which priorities take precedence when the field names several
+PRIORITY_PRECEDENCE = (Priority.HIGH, Priority.LOW, Priority.CRITICAL)
+
+# Requirements with critical errors are sent to the LLM in batches of up to
+# this many per fix prompt, instead of one round-trip per requirement
+CRITICAL_FIX_BATCH_SIZE = 16
+
+# LLMRequirement fields a critical error fix may return, and the
+# BusinessRequirement fields they replace; fields left out of a fix keep
+# their current values
+FIX_FIELDS = {
+    'title': 'title',
+    'description': 'description',
+    'citations': 'citations',
+    'stakeholders': 'stakeholders',
+    'acceptance_criteria': 'acceptance_criteria',
+    'priority': 'priority',
+    'business_value': 'business_value',
+    'tags': 'tags',
+    'dependencies': 'dependencies',
+    'constraint': 'constraints',
+    'notes': 'notes',
+}
+
+# Stage 1 input budget (rough estimate: 1 token ≈ 4 characters). Larger
+# documents are split into chunks that are extracted concurrently.
+MAX_STAGE1_PROMPT_TOKENS = 100000
+CHARS_PER_TOKEN = 4
+
+# Smallest document chunk worth an LLM call; if the fixed prompt leaves less
+# room than this, the budget is misconfigured rather than the document large
+MIN_STAGE1_CHUNK_CHARS = 4000
+
+# Start of a section in a parsed RFP: a markdown heading or "제N장"
+SECTION_HEADING_PATTERN = re.compile(r"^(?:#+ |제\s*\d+\s*장)", re.MULTILINE)
+
+# An obligation in a requirement statement; more than one suggests the
+# statement fuses several requirements
+OBLIGATION_PATTERN = re.compile(r"\b(?:must|shall|should)\b|(?:해야|하여야)\s*(?:한다|함)", re.IGNORECASE)
+
+# Static part of the stage 1 prompt; the documents are appended after it
+STAGE1_PROMPT_HEADER = """
+다음 RFP 문서들에서 비즈니스 요구사항을 추출해주세요.
+
+각 요구사항에 대해:
+1. 원문에서 직접 인용한 텍스트와 위치 정보를 포함하세요
+2. 명확성, 완전성, 일관성, 검증가능성 원칙을 적용하세요
+3. 근거가 불충분한 경우 가설로 분류하세요
+
+응답은 반드시 다음 JSON 형식을 따라주세요:
+{
+  "data": {
+    "requirements": [
+      {
+        "요구사항 ID": "BR_001",
+        "요구사항명": "요구사항 제목",
+        "고객 요구사항 상세 내용": "상세 설명",
+        "근거인용": [
+          {
+            "quote": "원문 인용",
+            "doc_id": "문서명",
+            "loc": "위치 정보"
+          }
+        ],
+        "이해관계자": ["이해관계자1", "이해관계자2"],
+        "수용기준(초안)": "수용 기준",
+        "우선순위": "높음/중간/낮음"
+      }
+    ]
+  },
+  "hypotheses": [
+    {
+      "hypothesis_id": "HYP_001",
+      "description": "가설 설명",
+      "confidence_level": 0.7
+    }
+  ]
+}
+
+분석할 문서들:
+        """
+
+# Stage 2 prompt, filled in with str.format
+STAGE2_PROMPT_TEMPLATE = """
+        Improve the following initial requirements draft by:
+        
+        1. Identifying missing, ambiguous, or duplicate requirements
+        2. Scanning documents by section (strategy, services, data, regulations, constraints)
+        3. Decomposing compound requirements into atomic ones
+        4. Improving traceability and citations
+        
+        Current Requirements: {requirement_count} items
+        Current Hypotheses: {hypothesis_count} items
+        
+        Review and improve these systematically.
+        """
+
+
+class LLMCitation(BaseModel):
+    """Citation as returned in the LLM's '근거인용' list."""
+    quote: str = ''
+    doc_id: str = ''
+    loc: Optional[str] = ''
+    context: Optional[str] = None
+
+
+class LLMRequirement(BaseModel):
+    """Requirement as returned by the LLM, keyed by the Korean field names in the prompt."""
+    br_id: Optional[str] = Field(None, alias='요구사항 ID')
+    title: str = Field('Untitled Requirement', alias='요구사항명')
+    description: str = Field('', alias='고객 요구사항 상세 내용')
+    citations: Optional[List[LLMCitation]] = Field(None, alias='근거인용')
+    stakeholders: Optional[List[str]] = Field(None, alias='이해관계자')
+    acceptance_criteria: Optional[str] = Field(None, alias='수용기준(초안)')
+    priority: Optional[str] = Field(None, alias='우선순위')
+    business_value: Optional[str] = Field(None, alias='가치/효익(초안)')
+    tags: Optional[List[str]] = Field(None, alias='별칭/동의어')
+    dependencies: Optional[List[str]] = Field(None, alias='중복병합근거')
+    constraint: Optional[str] = Field(None, alias='제약사항')
+    notes: Optional[str] = Field(None, alias='비고')
+
+
+# Validates a whole requirements list in a single pydantic-core call
+LLM_REQUIREMENTS_ADAPTER = TypeAdapter(List[LLMRequirement])
+
+
+class Stage1BudgetError(ValueError):
+    """The stage 1 prompt budget leaves too little room for document content."""
+
 
 class AnalyzerService:
     """
@@ -25,10 +193,10 @@ class AnalyzerService:
     Equivalent to the Solver role in Gemini's mathematical problem-solving approach.
     """
     
-    def __init__(self, settings: SystemSettings):
+    def __init__(self, settings: SystemSettings, llm_service: Optional[LLMService] = None):
         self.settings = settings
         self.system_prompt = settings.analyzer_system_prompt
-        self.llm_service = LLMService(settings)
+        self.llm_service = llm_service or LLMService(settings)
         
     async def generate_initial_draft(self, documents: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -46,100 +214,119 @@ class AnalyzerService:
         Returns:
             Dict containing 'requirements' and 'hypotheses' lists
         """
+        async def _documents():
+            for item in documents.items():
+                yield item
         
-        try:
-            # Build prompt for initial requirement extraction
-            user_prompt = self._build_stage1_prompt(documents)
-            
-            print(f"🧠 Stage 1: Calling LLM for initial requirement extraction...")
-            print(f"   📄 Documents to analyze: {len(documents)}")
-            print(f"   📝 System prompt length: {len(self.system_prompt)} characters")
-            print(f"   📝 User prompt length: {len(user_prompt)} characters")
-            
-            # Estimate total tokens (rough calculation: 1 token ≈ 4 characters)
-            total_chars = len(self.system_prompt) + len(user_prompt)
-            estimated_tokens = total_chars // 4
-            print(f"   🔢 Estimated input tokens: {estimated_tokens}")
-            
-            if estimated_tokens > 100000:  # Too large for most models
-                print(f"⚠️  Warning: Input too large ({estimated_tokens} tokens). Consider document chunking.")
-                # For now, proceed anyway - could implement chunking here later
-            
-            # Call LLM service
-            llm_response = await self.llm_service.call_llm_json(
-                system_prompt=self.system_prompt,
-                user_prompt=user_prompt,
-                temperature=0.1
-            )
-            
-            print(f"✅ LLM response received:")
-            print(f"   📊 Response type: {type(llm_response)}")
-            print(f"   🔍 Response keys: {list(llm_response.keys()) if isinstance(llm_response, dict) else 'Not a dict'}")
-            if isinstance(llm_response, dict) and 'data' in llm_response:
-                print(f"   📋 Data keys: {list(llm_response['data'].keys())}")
-                if 'requirements' in llm_response['data']:
-                    print(f"   📌 Requirements found: {len(llm_response['data']['requirements'])}")
-            print(f"   " + "="*50)
+        return await self.generate_initial_draft_from_stream(_documents())
+    
+    def _llm_call_limit(self) -> AsyncContextManager:
+        """
+        Limit on the concurrent LLM calls of one stage fan-out.
+        
+        Batch API calls are not limited: they only wait for their batch, and
+        holding permits meanwhile would split a fan-out into batches that
+        run one after another.
+        """
+        if self.llm_service.using_batch_api:
+            return nullcontext()
+        return asyncio.Semaphore(self.settings.max_concurrent_llm_calls)
+    
+    async def generate_initial_draft_from_stream(
+        self,
+        document_stream: AsyncIterator[Tuple[str, str]],
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Stage 1 over documents that become available one at a time.
+        
+        Each document's extraction starts as soon as the stream yields it, so
+        parsing of later documents overlaps with LLM calls for earlier ones.
+        Errors raised by the stream itself (e.g. parse failures) propagate.
+        
+        Args:
+            document_stream: Async iterator of (document name, content) pairs
+            on_progress: Called with (analyzed, received) document counts each
+                time a document's extraction finishes
             
-            # Parse LLM response and convert to our models
+        Returns:
+            Dict containing 'requirements' and 'hypotheses' lists
+        """
+        logger.info("Stage 1: extracting requirements with the LLM")
+        
+        # One LLM call per document, run concurrently with at most
+        # max_concurrent_llm_calls in flight
+        semaphore = self._llm_call_limit()
+        doc_names = []
+        tasks = []
+        analyzed = 0
+        
+        async def extract(doc_name: str, content: str) -> Dict[str, Any]:
+            nonlocal analyzed
+            try:
+                return await self._extract_from_document(doc_name, content, semaphore)
+            finally:
+                analyzed += 1
+                if on_progress is not None:
+                    on_progress(analyzed, len(doc_names))
+        
+        try:
+            async for doc_name, content in document_stream:
+                doc_names.append(doc_name)
+                tasks.append(asyncio.create_task(extract(doc_name, content)))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        logger.debug("Stage 1: %d documents to analyze", len(doc_names))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        try:
             requirements = []
             hypotheses = []
+            errors = []
+            for doc_name, result in zip(doc_names, results):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception) or isinstance(result, Stage1BudgetError):
+                        raise result
+                    logger.warning("Stage 1 extraction failed for %s: %s", doc_name, result)
+                    errors.append(result)
+                    continue
+                requirements.extend(result['requirements'])
+                hypotheses.extend(result['hypotheses'])
             
-            # Extract requirements from LLM response
-            if 'data' in llm_response and 'requirements' in llm_response['data']:
-                print(f"🔄 Processing {len(llm_response['data']['requirements'])} requirements from LLM...")
-                for i, req_data in enumerate(llm_response['data']['requirements']):
-                    try:
-                        # Convert LLM response to BusinessRequirement model
-                        requirement = self._convert_llm_to_requirement(req_data)
-                        requirements.append(requirement)
-                        print(f"   ✅ Requirement {i+1}: {requirement.title[:50]}...")
-                    except Exception as e:
-                        print(f"   ❌ Error converting requirement {i+1}: {e}")
-                        print(f"      📋 Req data keys: {list(req_data.keys()) if isinstance(req_data, dict) else 'Not a dict'}")
-                        continue
-            else:
-                print(f"⚠️  No requirements found in LLM response structure")
-                if isinstance(llm_response, dict):
-                    print(f"   📋 Available keys: {list(llm_response.keys())}")
-                    if 'data' in llm_response:
-                        print(f"   📋 Data keys: {list(llm_response['data'].keys())}")
-                print(f"   📄 Raw LLM response preview: {str(llm_response)[:500]}...")
+            # Fall back to sample data only if no document could be analyzed
+            if errors and len(errors) == len(doc_names):
+                raise errors[0]
             
-            # Extract hypotheses if present
-            if 'hypotheses' in llm_response:
-                for hyp_data in llm_response['hypotheses']:
-                    try:
-                        hypothesis = HypothesisRequirement(
-                            hypothesis_id=hyp_data.get('hypothesis_id', f"HYP_{uuid.uuid4().hex[:8]}"),
-                            description=hyp_data.get('description', ''),
-                            rationale=hyp_data.get('rationale', ''),
-                            confidence_level=hyp_data.get('confidence_level', 0.5),
-                            evidence_needed=hyp_data.get('evidence_needed', [])
-                        )
-                        hypotheses.append(hypothesis)
-                    except Exception as e:
-                        print(f"Error converting hypothesis: {e}")
-                        continue
+            # Each document's response numbers its items from scratch
+            # (BR_001, HYP_001, ...), so make IDs unique across documents
+            self._dedupe_ids(requirements, 'br_id')
+            self._dedupe_ids(hypotheses, 'hypothesis_id')
             
-            print(f"📊 Stage 1 Analysis Results:")
-            print(f"   📌 Total requirements extracted: {len(requirements)}")
-            print(f"   🔬 Total hypotheses extracted: {len(hypotheses)}")
+            logger.info(
+                "Stage 1: extracted %d requirements and %d hypotheses",
+                len(requirements), len(hypotheses)
+            )
             
             return {
                 'requirements': requirements,
                 'hypotheses': hypotheses
             }
             
+        except Stage1BudgetError:
+            # A configuration error, not an LLM failure; report it to the caller
+            raise
         except Exception as e:
             # Fallback to sample data if LLM call fails
-            print(f"LLM call failed, using sample data: {e}")
+            logger.warning("LLM call failed, using sample data: %s", e)
             
             example_requirements = []
-            if documents:
-                doc_name = list(documents.keys())[0]
+            if doc_names:
+                doc_name = doc_names[0]
                 sample_requirement = BusinessRequirement(
-                    br_id=f"BR_{uuid.uuid4().hex[:8]}",
+                    br_id=_generate_id("BR"),
                     title="Sample Requirement (LLM Failed)",
                     description=f"Failed to extract from {doc_name}. Please check LLM configuration.",
                     requirement_type=RequirementType.FUNCTIONAL,
@@ -163,6 +350,150 @@ class AnalyzerService:
                 'hypotheses': []
             }
     
+    async def _extract_from_document(
+        self,
+        doc_name: str,
+        content: str,
+        semaphore: AsyncContextManager
+    ) -> Dict[str, Any]:
+        """Run the stage 1 extraction for a single document."""
+        
+        # Room left for document content once the fixed parts of the prompt
+        # are accounted for
+        max_chars = (
+            MAX_STAGE1_PROMPT_TOKENS * CHARS_PER_TOKEN
+            - len(self.system_prompt)
+            - len(self._build_stage1_prompt({doc_name: ""}))
+        )
+        if max_chars < MIN_STAGE1_CHUNK_CHARS:
+            raise Stage1BudgetError(
+                f"Stage 1 system prompt and instructions leave only {max(max_chars, 0)} characters "
+                f"for document content within the {MAX_STAGE1_PROMPT_TOKENS}-token budget "
+                f"(minimum {MIN_STAGE1_CHUNK_CHARS}); shorten the analyzer system prompt"
+            )
+        chunks = self._split_document_by_sections(content, max_chars)
+        if len(chunks) == 1:
+            return await self._extract_from_chunk(doc_name, content, semaphore)
+        
+        logger.info("Stage 1: splitting %r into %d chunks", doc_name, len(chunks))
+        results = await asyncio.gather(
+            *(self._extract_from_chunk(doc_name, chunk, semaphore) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        requirements = []
+        hypotheses = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            requirements.extend(result['requirements'])
+            hypotheses.extend(result['hypotheses'])
+        
+        return {
+            'requirements': requirements,
+            'hypotheses': hypotheses
+        }
+    
+    async def _extract_from_chunk(
+        self,
+        doc_name: str,
+        content: str,
+        semaphore: AsyncContextManager
+    ) -> Dict[str, Any]:
+        """Run the stage 1 LLM call for a document, or one chunk of it."""
+        
+        # Build prompt for initial requirement extraction
+        user_prompt = self._build_stage1_prompt({doc_name: content})
+        
+        async with semaphore:
+            # Estimate total tokens (rough calculation: 1 token ≈ 4 characters)
+            estimated_tokens = (len(self.system_prompt) + len(user_prompt)) // CHARS_PER_TOKEN
+            logger.debug(
+                "Stage 1: calling LLM for %r (system prompt %d chars, user prompt %d chars, ~%d tokens)",
+                doc_name, len(self.system_prompt), len(user_prompt), estimated_tokens
+            )
+            
+            # Call LLM service
+            llm_response = await self.llm_service.call_llm_json(
+                system_prompt=self.system_prompt,
+                user_prompt=user_prompt,
+                temperature=0.1
+            )
+        
+        # Parse LLM response and convert to our models
+        requirements = []
+        hypotheses = []
+        
+        # Extract requirements from LLM response
+        if 'data' in llm_response and 'requirements' in llm_response['data']:
+            req_list = llm_response['data']['requirements']
+            logger.debug("Stage 1: processing %d requirements for %r", len(req_list), doc_name)
+            parsed_list = self._validate_llm_requirements(req_list)
+            now = datetime.now()
+            for i, (req_data, parsed) in enumerate(zip(req_list, parsed_list)):
+                try:
+                    if isinstance(parsed, ValidationError):
+                        raise parsed
+                    # Convert LLM response to BusinessRequirement model
+                    requirements.append(self._convert_llm_to_requirement(parsed, now))
+                except Exception as e:
+                    logger.warning("Error converting requirement %d from %r: %s", i + 1, doc_name, e)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Requirement data keys: %s",
+                            list(req_data.keys()) if isinstance(req_data, dict) else 'Not a dict'
+                        )
+                    continue
+        else:
+            logger.warning("No requirements found in LLM response structure for %r", doc_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw LLM response preview: %s...", str(llm_response)[:500])
+        
+        # Extract hypotheses if present
+        if 'hypotheses' in llm_response:
+            for hyp_data in llm_response['hypotheses']:
+                try:
+                    hypothesis = HypothesisRequirement(
+                        hypothesis_id=hyp_data.get('hypothesis_id') or _generate_id("HYP"),
+                        description=hyp_data.get('description', ''),
+                        rationale=hyp_data.get('rationale', ''),
+                        confidence_level=hyp_data.get('confidence_level', 0.5),
+                        evidence_needed=hyp_data.get('evidence_needed', [])
+                    )
+                    hypotheses.append(hypothesis)
+                except Exception as e:
+                    logger.warning("Error converting hypothesis: %s", e)
+                    continue
+        
+        return {
+            'requirements': requirements,
+            'hypotheses': hypotheses
+        }
+    
+    def needs_self_improvement(self, requirements: List[BusinessRequirement]) -> bool:
+        """
+        Quick local check for problems the stage 2 pass would fix.
+        
+        Flags an empty draft, requirements without citations, duplicate
+        descriptions and statements with more than one obligation. Missing
+        requirements cannot be detected locally, so a clean result is only
+        a reason to skip stage 2 when the pipeline is configured to.
+        """
+        if not requirements:
+            return True
+        
+        seen_descriptions = set()
+        for requirement in requirements:
+            if not requirement.citations:
+                return True
+            description = " ".join(requirement.description.lower().split())
+            if description in seen_descriptions:
+                return True
+            seen_descriptions.add(description)
+            if len(OBLIGATION_PATTERN.findall(description)) > 1:
+                return True
+        return False
+    
     async def self_improvement_pass(
         self, 
         current_requirements: List[BusinessRequirement],
@@ -197,19 +528,24 @@ class AnalyzerService:
                 temperature=0.1
             )
             
-            # Parse improved requirements
-            improved_requirements = current_requirements.copy()  # Start with current
-            improved_hypotheses = current_hypotheses.copy()
+            # Start from the current lists; they are returned as-is (not
+            # copied) when the LLM suggests nothing, so callers must not
+            # mutate them in place
+            improved_requirements = current_requirements
+            improved_hypotheses = current_hypotheses
             
             # Apply improvements from LLM response
             if 'data' in llm_response and 'requirements' in llm_response['data']:
                 improved_requirements = []
-                for req_data in llm_response['data']['requirements']:
+                now = datetime.now()
+                for parsed in self._validate_llm_requirements(llm_response['data']['requirements']):
                     try:
-                        requirement = self._convert_llm_to_requirement(req_data)
+                        if isinstance(parsed, ValidationError):
+                            raise parsed
+                        requirement = self._convert_llm_to_requirement(parsed, now)
                         improved_requirements.append(requirement)
                     except Exception as e:
-                        print(f"Error converting improved requirement: {e}")
+                        logger.warning("Error converting improved requirement: %s", e)
                         continue
             
             return {
@@ -218,7 +554,7 @@ class AnalyzerService:
             }
             
         except Exception as e:
-            print(f"Self-improvement LLM call failed: {e}")
+            logger.warning("Self-improvement LLM call failed: %s", e)
             # Return original requirements if improvement fails
             return {
                 'requirements': current_requirements,
@@ -247,104 +583,88 @@ class AnalyzerService:
             Dict containing fixed 'requirements' list
         """
         
-        # Group issues by BR ID for efficient processing
-        issues_by_br = {}
+        # Group issues (and critical errors separately) by BR ID in one pass
+        issues_by_br = defaultdict(list)
+        critical_by_br = defaultdict(list)
         for issue in issues:
-            if issue.br_id not in issues_by_br:
-                issues_by_br[issue.br_id] = []
             issues_by_br[issue.br_id].append(issue)
+            if issue.error_type == ErrorType.CRITICAL_ERROR:
+                critical_by_br[issue.br_id].append(issue)
+        
+        # Only requirements with issues need fixing. Critical errors go to the
+        # LLM in batches; justification gaps are fixed per requirement. All of
+        # it runs concurrently, with at most max_concurrent_llm_calls in flight
+        needs_fix = [i for i, req in enumerate(requirements) if req.br_id in issues_by_br]
+        critical = [i for i in needs_fix if requirements[i].br_id in critical_by_br]
+        gaps = [i for i in needs_fix if requirements[i].br_id not in critical_by_br]
+        critical_batches = [
+            critical[start:start + CRITICAL_FIX_BATCH_SIZE]
+            for start in range(0, len(critical), CRITICAL_FIX_BATCH_SIZE)
+        ]
+        
+        semaphore = self._llm_call_limit()
+        batch_results, gap_results = await asyncio.gather(
+            asyncio.gather(*(
+                self._fix_critical_errors(
+                    [(requirements[i], critical_by_br[requirements[i].br_id]) for i in batch],
+                    documents,
+                    semaphore
+                )
+                for batch in critical_batches
+            )),
+            asyncio.gather(*(
+                self._fix_justification_gaps_guarded(
+                    requirements[i], issues_by_br[requirements[i].br_id], documents, semaphore
+                )
+                for i in gaps
+            ))
+        )
         
-        fixed_requirements = []
-        
-        for req in requirements:
-            if req.br_id in issues_by_br:
-                # Apply fixes for this requirement
-                req_issues = issues_by_br[req.br_id]
-                
-                # Check for critical errors
-                critical_errors = [i for i in req_issues if i.error_type == "critical_error"]
-                
-                if critical_errors:
-                    try:
-                        # Try to fix critical errors with LLM
-                        fixed_req = await self._fix_critical_errors(req, critical_errors, documents)
-                        if fixed_req:
-                            fixed_requirements.append(fixed_req)
-                        # else: discard requirement if unfixable
-                    except Exception as e:
-                        print(f"Failed to fix critical errors for {req.br_id}: {e}")
-                        # Discard requirement if fixing fails
-                        continue
-                else:
-                    try:
-                        # Fix justification gaps
-                        improved_req = await self._fix_justification_gaps(req, req_issues, documents)
-                        fixed_requirements.append(improved_req)
-                    except Exception as e:
-                        print(f"Failed to fix justification gaps for {req.br_id}: {e}")
-                        # Keep original requirement if fixing fails
-                        fixed_requirements.append(req)
-            else:
-                # No issues with this requirement
-                fixed_requirements.append(req)
+        # Put fixed requirements back in their original positions and drop
+        # the discarded ones
+        results: List[Optional[BusinessRequirement]] = list(requirements)
+        for batch, fixed_batch in zip(critical_batches, batch_results):
+            for i, fixed_req in zip(batch, fixed_batch):
+                results[i] = fixed_req
+        for i, fixed_req in zip(gaps, gap_results):
+            results[i] = fixed_req
+        fixed_requirements = [req for req in results if req is not None]
         
         return {
             'requirements': fixed_requirements
         }
     
+    async def _fix_justification_gaps_guarded(
+        self,
+        req: BusinessRequirement,
+        req_issues: List[VerificationIssue],
+        documents: Dict[str, str],
+        semaphore: AsyncContextManager
+    ) -> BusinessRequirement:
+        """Fix justification gaps, keeping the original requirement if that fails."""
+        async with semaphore:
+            try:
+                return await self._fix_justification_gaps(req, req_issues, documents)
+            except Exception as e:
+                logger.warning("Failed to fix justification gaps for %s: %s", req.br_id, e)
+                # Keep original requirement if fixing fails
+                return req
+    
     def _build_stage1_prompt(self, documents: Dict[str, str]) -> str:
         """Build prompt for stage 1 initial draft generation."""
-        prompt = f"""
-다음 RFP 문서들에서 비즈니스 요구사항을 추출해주세요.
-
-각 요구사항에 대해:
-1. 원문에서 직접 인용한 텍스트와 위치 정보를 포함하세요
-2. 명확성, 완전성, 일관성, 검증가능성 원칙을 적용하세요
-3. 근거가 불충분한 경우 가설로 분류하세요
-
-응답은 반드시 다음 JSON 형식을 따라주세요:
-{{
-  "data": {{
-    "requirements": [
-      {{
-        "요구사항 ID": "BR_001",
-        "요구사항명": "요구사항 제목",
-        "고객 요구사항 상세 내용": "상세 설명",
-        "근거인용": [
-          {{
-            "quote": "원문 인용",
-            "doc_id": "문서명",
-            "loc": "위치 정보"
-          }}
-        ],
-        "이해관계자": ["이해관계자1", "이해관계자2"],
-        "수용기준(초안)": "수용 기준",
-        "우선순위": "높음/중간/낮음"
-      }}
-    ]
-  }},
-  "hypotheses": [
-    {{
-      "hypothesis_id": "HYP_001",
-      "description": "가설 설명",
-      "confidence_level": 0.7
-    }}
-  ]
-}}
-
-분석할 문서들:
-        """
         
+        # Collect the pieces and join once, rather than re-copying the whole
+        # prompt for every document appended
+        parts = [STAGE1_PROMPT_HEADER]
+        append = parts.append
         for doc_name, content in documents.items():
             # Include full document content for complete analysis
-            prompt += f"\n--- {doc_name} ---\n{content}\n"
-            print(f"📋 Document '{doc_name}' added to prompt:")
-            print(f"   📏 Full content length: {len(content)} characters")
-            print(f"   📖 Content preview: {content[:200]}...")
+            append(f"\n--- {doc_name} ---\n")
+            append(content)
+            append("\n")
         
-        print(f"📝 Final prompt statistics:")
-        print(f"   📏 Total prompt length: {len(prompt)} characters")
-        print(f"   📄 Number of documents included: {len(documents)}")
+        prompt = "".join(parts)
+        logger.debug("Stage 1 prompt: %d characters from %d documents", len(prompt), len(documents))
         
         return prompt
     
@@ -355,116 +675,235 @@ class AnalyzerService:
         documents: Dict[str, str]
     ) -> str:
         """Build prompt for stage 2 self-improvement."""
-        prompt = f"""
-        Improve the following initial requirements draft by:
-        
-        1. Identifying missing, ambiguous, or duplicate requirements
-        2. Scanning documents by section (strategy, services, data, regulations, constraints)
-        3. Decomposing compound requirements into atomic ones
-        4. Improving traceability and citations
+        prompt = STAGE2_PROMPT_TEMPLATE.format(
+            requirement_count=len(requirements),
+            hypothesis_count=len(hypotheses)
+        )
         
-        Current Requirements: {len(requirements)} items
-        Current Hypotheses: {len(hypotheses)} items
+        return prompt
+    
+    def _split_document_by_sections(self, content: str, max_chars: int) -> List[str]:
+        """
+        Split a document into chunks of at most max_chars characters.
         
-        Review and improve these systematically.
+        Chunks hold whole sections where possible; a section that is larger
+        than max_chars on its own is cut at line breaks.
         """
+        if len(content) <= max_chars:
+            return [content]
+        if max_chars < 1:
+            raise ValueError(f"Chunk size must be positive, got {max_chars}")
+        
+        starts = [match.start() for match in SECTION_HEADING_PATTERN.finditer(content)]
+        if not starts or starts[0] != 0:
+            starts.insert(0, 0)
+        ends = starts[1:] + [len(content)]
+        
+        chunks = []
+        chunk_start = 0
+        for start, end in zip(starts, ends):
+            # Close the current chunk if this section does not fit in it
+            if end - chunk_start > max_chars and start > chunk_start:
+                chunks.append(content[chunk_start:start])
+                chunk_start = start
+            
+            # Cut a section that is too large by itself at line breaks
+            while end - chunk_start > max_chars:
+                cut = content.rfind("\n", chunk_start, chunk_start + max_chars) + 1
+                if cut <= chunk_start:
+                    cut = chunk_start + max_chars
+                chunks.append(content[chunk_start:cut])
+                chunk_start = cut
+        
+        if chunk_start < len(content):
+            chunks.append(content[chunk_start:])
+        return chunks
+    
+    def _dedupe_ids(self, items: List[Any], id_field: str) -> None:
+        """Give every item after the first with an already-seen ID a unique suffix."""
+        seen = set()
+        for item in items:
+            item_id = getattr(item, id_field)
+            if item_id in seen:
+                item_id = _generate_id(item_id)
+                setattr(item, id_field, item_id)
+            seen.add(item_id)
+    
+    def _validate_llm_requirements(self, req_list: Any) -> List[Union[LLMRequirement, ValidationError]]:
+        """
+        Validate the LLM's requirement list in one pass.
         
-        return prompt
+        If any item is malformed, items are validated one by one instead so
+        the valid ones are kept; each invalid item yields its ValidationError.
+        """
+        try:
+            return LLM_REQUIREMENTS_ADAPTER.validate_python(req_list)
+        except ValidationError:
+            if not isinstance(req_list, list):
+                logger.warning("Expected a list of requirements, got %s", type(req_list).__name__)
+                return []
+        
+        results = []
+        for req_data in req_list:
+            try:
+                results.append(LLMRequirement.model_validate(req_data))
+            except ValidationError as e:
+                results.append(e)
+        return results
     
-    def _convert_llm_to_requirement(self, req_data: Dict[str, Any]) -> BusinessRequirement:
-        """Convert LLM response data to BusinessRequirement model."""
+    def _convert_llm_to_requirement(self, req: LLMRequirement, now: datetime) -> BusinessRequirement:
+        """
+        Convert a validated LLM requirement to the BusinessRequirement model.
+        
+        ``now`` is used for both created_at and updated_at, so requirements
+        from one LLM response share that response's processing time.
+        """
         
         # Extract citations
-        citations = []
-        for citation_data in req_data.get('근거인용', []):
-            citation = Citation(
-                text=citation_data.get('quote', ''),
+        citations = [
+            Citation(
+                text=citation.quote,
                 location=SourceLocation(
-                    document=citation_data.get('doc_id', ''),
-                    section=citation_data.get('loc', ''),
-                    page_number=None,
-                    paragraph=None
+                    document=citation.doc_id,
+                    section=citation.loc
                 ),
-                context=citation_data.get('context')
+                context=citation.context
             )
-            citations.append(citation)
+            for citation in req.citations or ()
+        ]
         
         # Extract acceptance criteria
-        acceptance_criteria = []
-        if req_data.get('수용기준(초안)'):
-            criteria = AcceptanceCriteria(
-                criterion_id=f"AC_{uuid.uuid4().hex[:6]}",
-                description=req_data['수용기준(초안)'],
+        acceptance_criteria = [
+            AcceptanceCriteria(
+                criterion_id=_generate_id("AC"),
+                description=req.acceptance_criteria,
                 testable=True
             )
-            acceptance_criteria.append(criteria)
+        ] if req.acceptance_criteria else []
         
         # Determine requirement type and priority
-        req_type = RequirementType.FUNCTIONAL  # Default
-        priority = Priority.MEDIUM  # Default
-        
-        if req_data.get('우선순위'):
-            priority_str = req_data['우선순위'].lower()
-            if 'high' in priority_str or '높음' in priority_str:
-                priority = Priority.HIGH
-            elif 'low' in priority_str or '낮음' in priority_str:
-                priority = Priority.LOW
-            elif 'critical' in priority_str or '중요' in priority_str:
-                priority = Priority.CRITICAL
+        req_type = DEFAULT_REQUIREMENT_TYPE
+        priority = DEFAULT_PRIORITY
+        
+        if req.priority:
+            matches = PRIORITY_PATTERN.findall(req.priority.lower())
+            if matches:
+                priority = min(
+                    (PRIORITY_KEYWORDS[keyword] for keyword in matches),
+                    key=PRIORITY_PRECEDENCE.index
+                )
         
         return BusinessRequirement(
-            br_id=req_data.get('요구사항 ID', f"BR_{uuid.uuid4().hex[:8]}"),
-            title=req_data.get('요구사항명', 'Untitled Requirement'),
-            description=req_data.get('고객 요구사항 상세 내용', ''),
+            br_id=req.br_id or _generate_id("BR"),
+            title=req.title,
+            description=req.description,
             requirement_type=req_type,
             priority=priority,
             citations=citations,
-            stakeholders=req_data.get('이해관계자') or [],
-            business_value=req_data.get('가치/효익(초안)'),
+            stakeholders=req.stakeholders or [],
+            business_value=req.business_value,
             acceptance_criteria=acceptance_criteria,
-            tags=req_data.get('별칭/동의어') or [],
-            dependencies=req_data.get('중복병합근거') or [],
-            constraints=[req_data.get('제약사항')] if req_data.get('제약사항') else [],
+            tags=req.tags or [],
+            dependencies=req.dependencies or [],
+            constraints=[req.constraint] if req.constraint else [],
             assumptions=[],
-            notes=req_data.get('비고')
+            notes=req.notes,
+            created_at=now,
+            updated_at=now
         )
     
     async def _fix_critical_errors(
         self, 
-        requirement: BusinessRequirement, 
-        errors: List[VerificationIssue],
-        documents: Dict[str, str]
-    ) -> Optional[BusinessRequirement]:
-        """Fix critical errors in a requirement using LLM."""
-        
-        error_descriptions = [error.description for error in errors]
+        batch: List[Tuple[BusinessRequirement, List[VerificationIssue]]],
+        documents: Dict[str, str],
+        semaphore: AsyncContextManager
+    ) -> List[Optional[BusinessRequirement]]:
+        """
+        Fix critical errors in a batch of requirements with a single LLM call.
         
-        prompt = f"""
-        다음 비즈니스 요구사항에서 발견된 치명적 오류를 수정해주세요:
+        Returns one entry per requirement, in order: the fixed requirement,
+        None if the LLM marked it as unfixable (it is discarded), or the
+        original if the LLM returned nothing usable for it. If the call
+        fails, the whole batch is discarded.
+        """
         
+        sections = []
+        for requirement, errors in batch:
+            error_lines = "\n".join(f"        - {error.description}" for error in errors)
+            sections.append(f"""
+        요구사항 ID: {requirement.br_id}
         요구사항: {requirement.title}
         설명: {requirement.description}
         
         발견된 오류들:
-        {chr(10).join(f'- {desc}' for desc in error_descriptions)}
+{error_lines}
+""")
         
-        원본 문서를 참조하여 요구사항을 수정하거나, 수정이 불가능하면 null을 반환하세요.
-        수정된 요구사항을 JSON 형태로 반환하세요.
+        prompt = f"""
+        다음 비즈니스 요구사항들에서 발견된 치명적 오류를 수정해주세요:
+        {"".join(sections)}
+        원본 문서를 참조하여 각 요구사항을 수정하세요.
+        {{"requirements": [...]}} 형태의 JSON 객체로 반환하고, 각 항목에는 "요구사항 ID"와
+        수정한 항목만 초기 추출과 같은 필드명으로 포함하세요.
+        수정이 불가능한 요구사항은 {{"요구사항 ID": "...", "폐기": true}}로 표시하세요.
         """
         
+        originals = [requirement for requirement, _ in batch]
         try:
-            response = await self.llm_service.call_llm(
-                system_prompt=self.system_prompt,
-                user_prompt=prompt,
-                temperature=0.1
+            async with semaphore:
+                response = await self.llm_service.call_llm_json(
+                    system_prompt=self.system_prompt,
+                    user_prompt=prompt,
+                    temperature=0.1
+                )
+        except Exception as e:
+            logger.warning(
+                "Failed to fix critical errors for %s: %s",
+                ", ".join(requirement.br_id for requirement in originals), e
             )
-            
-            # Try to parse as JSON and convert back to requirement
-            # For now, return the original requirement
-            return requirement
-            
-        except Exception:
-            return None  # Could not fix
+            # Discard requirements if fixing fails
+            return [None] * len(batch)
+        
+        entries = response.get('requirements') if isinstance(response, dict) else None
+        if not isinstance(entries, list):
+            logger.warning("Critical error fix response has no requirements list")
+            return [None] * len(batch)
+        
+        # Map the returned entries back to the batch by requirement ID
+        fixed_by_id: Dict[str, Optional[BusinessRequirement]] = {}
+        positions = {requirement.br_id: i for i, requirement in enumerate(originals)}
+        now = datetime.now()
+        for entry in entries:
+            br_id = entry.get('요구사항 ID') if isinstance(entry, dict) else None
+            if br_id not in positions:
+                continue
+            if entry.get('폐기') is True:
+                fixed_by_id[br_id] = None
+                continue
+            try:
+                parsed = LLMRequirement.model_validate(entry)
+            except ValidationError as e:
+                logger.warning("Invalid fix for %s, keeping the original: %s", br_id, e)
+                continue
+            fixed_by_id[br_id] = self._apply_requirement_fix(originals[positions[br_id]], parsed, now)
+        
+        return [fixed_by_id.get(requirement.br_id, requirement) for requirement in originals]
+    
+    def _apply_requirement_fix(
+        self,
+        original: BusinessRequirement,
+        fix: LLMRequirement,
+        now: datetime
+    ) -> BusinessRequirement:
+        """Update a requirement with the fields an LLM fix returned, keeping the rest."""
+        converted = self._convert_llm_to_requirement(fix, now)
+        update = {
+            target: getattr(converted, target)
+            for source, target in FIX_FIELDS.items()
+            if source in fix.model_fields_set
+        }
+        update['updated_at'] = now
+        return original.model_copy(update=update)
     
     async def _fix_justification_gaps(
         self, 
@@ -0,0 +1,126 @@
+"""Run chat completion requests through the OpenAI Batch API."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Tuple
+
+import orjson
+from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+
+# Seconds between batch status checks
+BATCH_POLL_INTERVAL = 30.0
+
+# Requests are collected until none has arrived for this many seconds, so a
+# stage's concurrent fan-out is submitted as one batch
+BATCH_COLLECT_DELAY = 0.05
+
+# Batch statuses after which no more results will arrive
+BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+class BatchCollector:
+    """
+    Collect concurrent chat completion requests into Batch API jobs.
+
+    Each ``create`` call waits for the response body of its own request. The
+    requests of callers that arrive together are uploaded as one JSONL file
+    and run as a single batch, which costs half as much as synchronous calls
+    but may take up to the 24 hour completion window.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        collect_delay: float = BATCH_COLLECT_DELAY
+    ):
+        self.client = client
+        self.poll_interval = poll_interval
+        self.collect_delay = collect_delay
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_task = None
+
+    async def create(self, request_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one chat completion request in the next batch and return its response body."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request_params, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        return await future
+
+    async def _flush(self):
+        # Wait until requests stop arriving, then take everything collected
+        count = -1
+        while count != len(self._pending):
+            count = len(self._pending)
+            await asyncio.sleep(self.collect_delay)
+        batch, self._pending, self._flush_task = self._pending, [], None
+
+        try:
+            results = await self._run_batch([params for params, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for i, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            result = results.get(str(i))
+            if result is None:
+                future.set_exception(ValueError(f"Batch returned no result for request {i}"))
+            elif isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _run_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Upload the requests, wait for the batch to finish and read its results.
+
+        Returns:
+            Response body (or the exception it failed with) by custom_id
+        """
+        lines = [
+            orjson.dumps({"custom_id": str(i), "method": "POST", "url": BATCH_ENDPOINT, "body": body})
+            for i, body in enumerate(requests)
+        ]
+        input_file = await self.client.files.create(file=("batch.jsonl", b"\n".join(lines)), purpose="batch")
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW
+        )
+        logger.info("Submitted batch %s with %d requests", batch.id, len(requests))
+
+        while batch.status not in BATCH_FINAL_STATUSES:
+            await asyncio.sleep(self.poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+        logger.info("Batch %s finished with status %s", batch.id, batch.status)
+
+        # Expired or cancelled batches still report the requests that completed
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await self.client.files.content(file_id)
+            for line in content.content.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[record["custom_id"]] = response["body"]
+                else:
+                    error = record.get("error") or response.get("body")
+                    results[record["custom_id"]] = ValueError(f"Batch request failed: {error}")
+
+        if not results and batch.status != "completed":
+            raise ValueError(f"Batch {batch.id} {batch.status}")
+        return results
@@ -1,105 +1,232 @@
 """Document parsing service for various file formats."""
 
 import asyncio
+import io
+import multiprocessing
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, BinaryIO, Dict, List, Optional, Tuple, Union
 import tempfile
 import os
 
-from markitdown import MarkItDown
+if TYPE_CHECKING:
+    from markitdown import MarkItDown
+
+
+# A document is either a file path or a (filename, binary file object) pair,
+# e.g. an upload that was kept in memory instead of being written to disk
+DocumentSource = Union[str, Tuple[str, BinaryIO]]
+
+SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.md', '.txt', '.docx', '.pptx', '.xlsx'})
+
+
+def document_source_name(source: DocumentSource) -> str:
+    """Get the filename of a document source."""
+    if isinstance(source, tuple):
+        return source[0]
+    return Path(source).name
+
+
+@lru_cache(maxsize=2048)
+def _is_supported_filename(filename: str) -> bool:
+    """Extension check, cached since the same filenames recur across batches."""
+    return Path(filename).suffix.lower() in SUPPORTED_EXTENSIONS
+
+
+# MarkItDown instance of a conversion worker process, created once per worker
+_worker_markitdown: Optional["MarkItDown"] = None
+
+
+def _init_markitdown_worker():
+    # markitdown pulls in pdfminer and the Office converters, so it is only
+    # imported by the worker processes that actually convert documents
+    from markitdown import MarkItDown
+    
+    global _worker_markitdown
+    _worker_markitdown = MarkItDown()
+
+
+def _sync_parse_standalone(filename: str, data: Union[str, bytes]) -> str:
+    """
+    Convert a document with markitdown in a worker process.
+    
+    Args:
+        filename: Name of the document, used to detect its format
+        data: File path, or the document's bytes for in-memory uploads
+    """
+    from markitdown import StreamInfo
+    
+    try:
+        if isinstance(data, bytes):
+            result = _worker_markitdown.convert_stream(
+                io.BytesIO(data),
+                stream_info=StreamInfo(extension=Path(filename).suffix.lower(), filename=filename)
+            )
+        else:
+            result = _worker_markitdown.convert(data)
+        return result.text_content
+    except Exception as e:
+        raise ValueError(f"markitdown parsing failed: {str(e)}")
 
 
 class DocumentParserService:
     """Service for parsing documents in various formats."""
     
     def __init__(self):
-        self.markitdown = MarkItDown()
-        self.supported_extensions = {'.pdf', '.md', '.txt', '.docx', '.pptx', '.xlsx'}
+        self.supported_extensions = SUPPORTED_EXTENSIONS
+        # Dedicated pool for file reads, so the documents of one request are
+        # read in parallel without competing with other users of the default
+        # executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="document-parser"
+        )
+        # Worker processes for markitdown, started on the first conversion
+        self._proc_pool: Optional[ProcessPoolExecutor] = None
+        self._closed = False
+        # Parser for each supported extension: markdown and text files are
+        # read directly, PDF and Office documents go through markitdown
+        self._parsers = {
+            '.md': self._read_text_file,
+            '.txt': self._read_text_file,
+            '.pdf': self._parse_with_markitdown,
+            '.docx': self._parse_with_markitdown,
+            '.pptx': self._parse_with_markitdown,
+            '.xlsx': self._parse_with_markitdown,
+        }
+    
+    def close(self):
+        """Shut down the parser's worker processes and threads, waiting for them to exit."""
+        self._closed = True
+        if self._proc_pool is not None:
+            self._proc_pool.shutdown(cancel_futures=True)
+        self._executor.shutdown(cancel_futures=True)
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the markitdown worker pool, creating it on first use."""
+        if self._closed:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        if self._proc_pool is None:
+            # markitdown conversions are CPU-bound pure Python, so they run in
+            # worker processes to use every core instead of contending for
+            # the GIL. Workers are spawned rather than forked, since forking
+            # a process that already runs threads can deadlock them.
+            self._proc_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_markitdown_worker
+            )
+        return self._proc_pool
     
     def is_supported_file(self, filename: str) -> bool:
         """Check if the file format is supported."""
-        return Path(filename).suffix.lower() in self.supported_extensions
+        return _is_supported_filename(filename)
     
-    async def parse_documents(self, file_paths: List[str]) -> Dict[str, str]:
+    async def parse_documents(self, sources: List[DocumentSource]) -> Dict[str, str]:
         """
         Parse multiple documents and return their text content.
         
         Args:
-            file_paths: List of file paths to parse
+            sources: List of file paths or (filename, file object) pairs to parse
             
         Returns:
             Dict mapping filename to parsed text content
         """
-        documents = {}
+        return {filename: content async for filename, content in self.parse_documents_stream(sources)}
+    
+    async def parse_documents_stream(self, sources: List[DocumentSource]) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Parse multiple documents concurrently, yielding each as it is ready.
         
-        print(f"📄 Starting document parsing for {len(file_paths)} files:")
-        for file_path in file_paths:
-            print(f"   - {Path(file_path).name}")
+        Every document starts parsing immediately; (filename, content) pairs
+        are yielded in upload order, so a consumer can start working on the
+        first document while the rest are still being converted.
         
-        for file_path in file_paths:
-            try:
-                filename = Path(file_path).name
-                
-                if not self.is_supported_file(filename):
-                    raise ValueError(f"Unsupported file format: {filename}")
-                
-                print(f"🔄 Parsing {filename}...")
-                content = await self._parse_single_document(file_path)
-                documents[filename] = content
-                
-                # Log content preview
-                content_preview = content[:300] + "..." if len(content) > 300 else content
-                print(f"✅ {filename} parsed successfully")
-                print(f"   📝 Content length: {len(content)} characters")
-                print(f"   📖 Preview: {content_preview}")
-                print(f"   " + "="*50)
-                
-            except Exception as e:
-                print(f"❌ Error parsing {filename}: {str(e)}")
-                raise ValueError(f"Error parsing {filename}: {str(e)}")
+        Raises:
+            ValueError: If a document cannot be parsed; the remaining parses
+                are cancelled
+        """
+        print(f"📄 Starting document parsing for {len(sources)} files:")
+        for source in sources:
+            print(f"   - {document_source_name(source)}")
+        
+        tasks = [asyncio.ensure_future(self._parse_source(source)) for source in sources]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark failures of documents we never got to as retrieved
+                    task.exception()
+        
+        print(f"✅ Document parsing completed. Total documents: {len(tasks)}")
+    
+    async def _parse_source(self, source: DocumentSource) -> Tuple[str, str]:
+        """Parse one document source, returning (filename, content)."""
+        filename = document_source_name(source)
+        try:
+            if not self.is_supported_file(filename):
+                raise ValueError(f"Unsupported file format: {filename}")
+            
+            print(f"🔄 Parsing {filename}...")
+            content = await self._parse_single_document(source)
+            
+            # Log content preview
+            content_preview = content[:300] + "..." if len(content) > 300 else content
+            print(f"✅ {filename} parsed successfully")
+            print(f"   📝 Content length: {len(content)} characters")
+            print(f"   📖 Preview: {content_preview}")
+            print(f"   " + "="*50)
+            
+        except Exception as e:
+            print(f"❌ Error parsing {filename}: {str(e)}")
+            raise ValueError(f"Error parsing {filename}: {str(e)}")
         
-        print(f"✅ Document parsing completed. Total documents: {len(documents)}")
-        return documents
+        return filename, content
     
-    async def _parse_single_document(self, file_path: str) -> str:
+    async def _parse_single_document(self, source: DocumentSource) -> str:
         """Parse a single document and return its text content."""
-        path = Path(file_path)
-        extension = path.suffix.lower()
+        extension = Path(document_source_name(source)).suffix.lower()
         
-        if extension == '.md':
-            # Read markdown files directly
-            return await self._read_text_file(file_path)
-        elif extension == '.txt':
-            # Read text files directly
-            return await self._read_text_file(file_path)
-        elif extension in {'.pdf', '.docx', '.pptx', '.xlsx'}:
-            # Use markitdown for PDF and Office documents
-            return await self._parse_with_markitdown(file_path)
-        else:
+        parse = self._parsers.get(extension)
+        if parse is None:
             raise ValueError(f"Unsupported file extension: {extension}")
+        return await parse(source)
     
-    async def _read_text_file(self, file_path: str) -> str:
-        """Read text/markdown files directly."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(file_path, 'r', encoding='cp949') as f:
-                return f.read()
-    
-    async def _parse_with_markitdown(self, file_path: str) -> str:
-        """Parse document using markitdown in a thread pool."""
-        def _sync_parse():
+    async def _read_text_file(self, source: DocumentSource) -> str:
+        """Read text/markdown files directly in the parser thread pool."""
+        def _sync_read():
+            # Read the bytes once and decode them, so a fallback to another
+            # encoding does not read the file a second time
+            if isinstance(source, tuple):
+                data = source[1].read()
+            else:
+                data = Path(source).read_bytes()
+            
             try:
-                result = self.markitdown.convert(file_path)
-                return result.text_content
-            except Exception as e:
-                raise ValueError(f"markitdown parsing failed: {str(e)}")
+                return data.decode('utf-8')
+            except UnicodeDecodeError:
+                # Try with different encoding
+                return data.decode('cp949')
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _sync_read)
+    
+    async def _parse_with_markitdown(self, source: DocumentSource) -> str:
+        """Parse document using markitdown in a worker process."""
+        loop = asyncio.get_running_loop()
+        if isinstance(source, tuple):
+            # File objects cannot be sent to another process; pass their bytes
+            filename, stream = source
+            data = await loop.run_in_executor(self._executor, stream.read)
+        else:
+            filename, data = document_source_name(source), source
         
-        # Run markitdown in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _sync_parse)
+        return await loop.run_in_executor(self._get_process_pool(), _sync_parse_standalone, filename, data)
     
     def get_document_metadata(self, file_path: str) -> Dict[str, str]:
         """Extract basic metadata from document."""
@@ -0,0 +1,65 @@
+"""Content-addressed disk cache for LLM responses."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import aiofiles
+import aiofiles.os
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Store LLM response texts on disk, keyed by a SHA-256 of the request.
+
+    The key covers everything sent to the API (model, messages, temperature,
+    max tokens, response format), so any change to a prompt or setting is a
+    miss. Entries older than ``ttl`` seconds are misses and get replaced by
+    the next response; with a ttl of 0 they never expire. Delete the
+    directory to clear the cache.
+    """
+
+    def __init__(self, cache_dir: str, ttl: int = 0):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(request_params: Dict[str, Any]) -> str:
+        """Hash the request parameters into a cache key."""
+        return hashlib.sha256(orjson.dumps(request_params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response text, or None on a miss."""
+        path = self._path(key)
+        try:
+            if self.ttl and time.time() - (await aiofiles.os.stat(path)).st_mtime > self.ttl:
+                return None
+            async with aiofiles.open(path, 'rb') as f:
+                return orjson.loads(await f.read())["content"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable LLM cache entry %s: %s", key, e)
+            return None
+
+    async def set(self, key: str, content: str) -> None:
+        """Store a response text, replacing any existing entry atomically."""
+        try:
+            await aiofiles.os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            async with aiofiles.open(tmp_path, 'wb') as f:
+                await f.write(orjson.dumps({"content": content}))
+            await aiofiles.os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            logger.warning("Could not write LLM cache entry %s: %s", key, e)
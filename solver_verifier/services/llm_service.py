@@ -1,14 +1,35 @@
 """LLM service for interacting with OpenAI API."""
 
 import asyncio
-import json
 import logging
-from typing import Dict, Any, Optional, List
-from openai import AsyncOpenAI
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+
+import httpx
+import orjson
+from openai import APIStatusError, AsyncOpenAI, DefaultAsyncHttpxClient, RateLimitError
 from ..models.agent_config import SystemSettings
+from .batch_api import BatchCollector
+from .llm_cache import LLMResponseCache
+from .rate_limiter import AdaptiveSemaphore, TokenBucketLimiter, retry_after_seconds
 
 logger = logging.getLogger(__name__)
 
+# Size of the client's connection pool; concurrent calls beyond this wait for
+# a free connection. Over HTTP/2 many calls are multiplexed on one connection.
+LLM_MAX_CONNECTIONS = 64
+
+# Retry backoff: a random delay of up to RETRY_BASE_DELAY * 2**attempt seconds
+# ("full jitter", so concurrent callers do not retry in lockstep), capped at
+# RETRY_MAX_DELAY. A longer Retry-After from the server takes precedence.
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+
+# Set within LLMService.batch_api(); tasks started there inherit it
+_use_batch_api: ContextVar[bool] = ContextVar("use_batch_api", default=False)
+
 
 class LLMService:
     """Service for interacting with OpenAI LLM API."""
@@ -19,7 +40,31 @@ class LLMService:
             logger.warning("OpenAI API key not provided. LLM calls will fail.")
             self.client = None
         else:
-            self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+            # One pooled HTTP/2 client reused by every call, so stage fan-outs
+            # share warm connections instead of opening new ones
+            # Retries are left to _call_with_retry, so every attempt goes
+            # through the limiters below and every 429 reaches them
+            self.client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                max_retries=0,
+                http_client=DefaultAsyncHttpxClient(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=LLM_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_MAX_CONNECTIONS
+                    )
+                )
+            )
+        self.batch_collector = BatchCollector(self.client) if self.client else None
+        # Calls in progress by (batch mode, request key), shared by identical
+        # concurrent requests
+        self._inflight: Dict[Tuple[bool, str], asyncio.Future] = {}
+        self.cache = LLMResponseCache(settings.llm_cache_dir, settings.llm_cache_ttl) if settings.llm_cache_dir else None
+        # Caps API calls in flight across all stages, backing off below
+        # max_concurrent_llm_calls when the provider reports rate limiting
+        self.limiter = AdaptiveSemaphore(settings.max_concurrent_llm_calls)
+        # Paces calls to the account's requests/tokens per minute, if configured
+        self.throttle = TokenBucketLimiter(settings.llm_requests_per_minute, settings.llm_tokens_per_minute)
     
     async def call_llm(
         self,
@@ -71,37 +116,101 @@ class LLMService:
             if response_format == "json":
                 request_params["response_format"] = {"type": "json_object"}
             
-            logger.debug(f"Calling OpenAI API with model: {self.settings.openai_model}")
-            
-            # Make API call with retry logic
-            response = await self._call_with_retry(request_params)
-            
-            content = response.choices[0].message.content
-            if not content:
-                raise ValueError("Empty response from OpenAI API")
-            
-            logger.debug(f"Received response with {len(content)} characters")
-            return content.strip()
+            # Identical requests share one call: join the one in flight, if
+            # any. Only within the same mode, so a direct call never waits on
+            # a Batch API job
+            key = LLMResponseCache.make_key(request_params)
+            inflight_key = (self.using_batch_api, key)
+            call = self._inflight.get(inflight_key)
+            if call is None:
+                call = asyncio.ensure_future(self._fetch_content(request_params, key))
+                self._inflight[inflight_key] = call
+                call.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+            # Shielded so a cancelled caller does not fail the others waiting
+            return await asyncio.shield(call)
             
         except Exception as e:
             logger.error(f"OpenAI API call failed: {str(e)}")
             raise Exception(f"LLM service error: {str(e)}") from e
     
+    async def _fetch_content(self, request_params: Dict[str, Any], key: str) -> str:
+        """Get the response text for a request, from the cache or the API."""
+        # Serve identical requests from the response cache when enabled
+        if self.cache is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit: {key}")
+                return cached
+        
+        logger.debug(f"Calling OpenAI API with model: {self.settings.openai_model}")
+        
+        if _use_batch_api.get():
+            response_body = await self.batch_collector.create(request_params)
+            content = response_body["choices"][0]["message"]["content"]
+        else:
+            # Make API call with retry logic
+            response = await self._call_with_retry(request_params)
+            content = response.choices[0].message.content
+        if not content:
+            raise ValueError("Empty response from OpenAI API")
+        
+        logger.debug(f"Received response with {len(content)} characters")
+        content = content.strip()
+        if self.cache is not None:
+            await self.cache.set(key, content)
+        return content
+    
+    @property
+    def using_batch_api(self) -> bool:
+        """Whether calls made in the current context go through the Batch API."""
+        return _use_batch_api.get()
+    
+    @contextmanager
+    def batch_api(self) -> Iterator[None]:
+        """
+        Send the LLM calls made in this context through the Batch API.
+        
+        Covers calls from tasks started within the context as well. Concurrent
+        calls are grouped into batches, which cost half as much as regular
+        calls but may take up to 24 hours to complete.
+        """
+        token = _use_batch_api.set(True)
+        try:
+            yield
+        finally:
+            _use_batch_api.reset(token)
+    
     async def _call_with_retry(self, request_params: Dict[str, Any], max_retries: int = 3) -> Any:
-        """Call OpenAI API with exponential backoff retry."""
+        """Call OpenAI API, retrying failures with jittered exponential backoff."""
+        
+        # Tokens the request may use: prompt (rough calculation: 1 token ≈ 4
+        # characters) plus the completion limit
+        estimated_tokens = (
+            sum(len(message["content"]) for message in request_params["messages"]) // 4
+            + request_params["max_tokens"]
+        )
         
         for attempt in range(max_retries + 1):
             try:
-                response = await self.client.chat.completions.create(**request_params)
-                return response
+                async with self.limiter:
+                    await self.throttle.acquire(estimated_tokens)
+                    raw_response = await self.client.chat.completions.with_raw_response.create(**request_params)
+                    self.limiter.on_response(raw_response.headers)
+                return raw_response.parse()
                 
             except Exception as e:
+                if isinstance(e, RateLimitError):
+                    self.limiter.on_rate_limited()
                 if attempt == max_retries:
                     raise e
                 
                 # Calculate backoff delay
-                delay = (2 ** attempt) + (0.1 * attempt)  # Exponential backoff with jitter
-                logger.warning(f"API call failed (attempt {attempt + 1}), retrying in {delay}s: {str(e)}")
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+                if isinstance(e, APIStatusError):
+                    retry_after = retry_after_seconds(e.response.headers)
+                    if retry_after is not None:
+                        delay = max(delay, min(retry_after, RETRY_MAX_DELAY))
+                logger.warning(f"API call failed (attempt {attempt + 1}), retrying in {delay:.1f}s: {str(e)}")
                 await asyncio.sleep(delay)
         
         raise Exception("Max retries exceeded")
@@ -138,17 +247,67 @@ class LLMService:
         )
         
         try:
-            parsed_json = json.loads(response_text)
-            print(f"✅ JSON parsing successful:")
-            print(f"   📊 Response structure: {list(parsed_json.keys()) if isinstance(parsed_json, dict) else type(parsed_json)}")
+            parsed_json = orjson.loads(response_text)
+            logger.debug(f"Parsed JSON response: {list(parsed_json.keys()) if isinstance(parsed_json, dict) else type(parsed_json)}")
             return parsed_json
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON parsing failed:")
-            print(f"   📄 Raw response preview: {response_text[:500]}...")
-            print(f"   🔍 JSON error: {str(e)}")
-            logger.error(f"Failed to parse JSON response: {response_text[:500]}...")
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Failed to parse JSON response ({len(response_text)} characters): {str(e)}")
+            logger.debug(f"Unparsable response preview: {response_text[:500]}...")
             raise ValueError(f"Invalid JSON response from LLM: {str(e)}") from e
     
+    async def call_llm_batch(
+        self,
+        system_prompt: str,
+        user_prompts: List[str],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Run several independent JSON tasks in a single LLM request.
+        
+        The prompts are sent as numbered tasks and the model is asked for one
+        result per task, so N tasks cost one request against the rate limit
+        instead of N.
+        
+        Args:
+            system_prompt: System message shared by all tasks
+            user_prompts: One prompt per task, each asking for a JSON response
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            
+        Returns:
+            Parsed JSON result of each task, in task order
+            
+        Raises:
+            ValueError: If the response does not hold exactly one result per task
+        """
+        if len(user_prompts) == 1:
+            return [await self.call_llm_json(system_prompt, user_prompts[0], temperature, max_tokens)]
+        
+        parts = [
+            f"Complete each of the following {len(user_prompts)} tasks independently.\n"
+            'Respond with a JSON object of the form {"results": [...]}, where "results" '
+            "holds exactly one entry per task, in task order, each being the JSON "
+            "response that task asks for.\n"
+        ]
+        for i, user_prompt in enumerate(user_prompts, 1):
+            parts.append(f"\n### Task {i}\n{user_prompt}\n")
+        
+        response = await self.call_llm_json(
+            system_prompt=system_prompt,
+            user_prompt="".join(parts),
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        results = response.get("results") if isinstance(response, dict) else None
+        if not isinstance(results, list) or len(results) != len(user_prompts):
+            raise ValueError(
+                f"Batched LLM response has {len(results) if isinstance(results, list) else 'no'} "
+                f"results for {len(user_prompts)} tasks"
+            )
+        return results
+    
     async def test_connection(self) -> bool:
         """Test OpenAI API connection."""
         try:
@@ -162,6 +321,11 @@ class LLMService:
             logger.error(f"OpenAI connection test failed: {str(e)}")
             return False
     
+    async def aclose(self):
+        """Close the underlying HTTP client and its pooled connections."""
+        if self.client is not None:
+            await self.client.close()
+    
     def is_configured(self) -> bool:
         """Check if LLM service is properly configured."""
         return self.client is not None and bool(self.settings.openai_api_key)
\ No newline at end of file
@@ -2,10 +2,16 @@
 
 import uuid
 import asyncio
+import hashlib
+from contextlib import nullcontext
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Any
+from typing import AsyncIterator, List, Dict, Optional, Set, Tuple, Any
 from pathlib import Path
 
+import aiofiles
+import aiofiles.os
+import orjson
+
 from ..models.business_requirement import (
     BusinessRequirement, 
     RequirementSet, 
@@ -18,9 +24,98 @@ from ..models.business_requirement import (
 from ..models.agent_config import SystemSettings, AgentPromptConfig
 from ..models.progress import PipelineProgress, PipelineStep, ProgressStatus, ProgressUpdate
 from .analyzer_service import AnalyzerService
+from .llm_service import LLMService
 from .verifier_service import VerifierService
-from .document_parser import DocumentParserService
-from .websocket_manager import websocket_manager
+from .document_parser import DocumentParserService, DocumentSource, document_source_name
+from .websocket_manager import progress_sender
+
+
+def _requirements_fingerprint(requirements: List[BusinessRequirement]) -> str:
+    """Digest of the requirements' content, to tell whether they changed."""
+    serialized = orjson.dumps([requirement.model_dump() for requirement in requirements])
+    return hashlib.blake2b(serialized, digest_size=16).hexdigest()
+
+
+def _serialize_results(requirement_set: RequirementSet, session_id: str) -> bytes:
+    """Encode pipeline results as the JSON document saved to the output directory."""
+    result_data = {
+        "metadata": {
+            "session_id": session_id,
+            "set_id": requirement_set.set_id,
+            "name": requirement_set.name,
+            "description": requirement_set.description,
+            "status": requirement_set.status,
+            "pipeline_stage": requirement_set.pipeline_stage,
+            "source_documents": requirement_set.source_documents,
+            "created_at": requirement_set.created_at,
+            "updated_at": requirement_set.updated_at,
+            "total_requirements": len(requirement_set.business_requirements),
+            "total_hypotheses": len(requirement_set.hypotheses),
+            "total_verification_issues": len(requirement_set.verification_issues)
+        },
+        "business_requirements": [
+            {
+                "requirement_id": req.br_id,
+                "title": req.title,
+                "description": req.description,
+                "category": req.requirement_type,
+                "priority": req.priority,
+                "stakeholders": req.stakeholders,
+                "acceptance_criteria": [
+                    {
+                        "criterion_id": ac.criterion_id,
+                        "description": ac.description,
+                        "testable": ac.testable
+                    } for ac in req.acceptance_criteria
+                ],
+                "citations": [
+                    {
+                        "text": citation.text,
+                        "source_document": citation.location.document,
+                        "page_number": citation.location.page_number,
+                        "section": citation.location.section,
+                        "line_number": citation.location.line_number,
+                        "paragraph": citation.location.paragraph,
+                        "context": citation.context
+                    } for citation in req.citations
+                ],
+                "tags": req.tags,
+                "created_at": req.created_at
+            } for req in requirement_set.business_requirements
+        ],
+        "hypotheses": [
+            {
+                "hypothesis_id": hyp.hypothesis_id,
+                "description": hyp.description,
+                "confidence_score": hyp.confidence_level,
+                "supporting_evidence": hyp.evidence_needed,
+                "created_at": hyp.created_at
+            } for hyp in requirement_set.hypotheses
+        ],
+        "verification_issues": [
+            {
+                "issue_id": issue.issue_id,
+                "error_type": issue.error_type,
+                "severity": issue.severity,
+                "description": issue.description,
+                "affected_requirement_id": issue.br_id,
+                "suggested_fix": issue.suggested_fix,
+                "created_at": issue.created_at
+            } for issue in requirement_set.verification_issues
+        ],
+        "coverage_metrics": {
+            "recall": requirement_set.coverage_metrics.recall if requirement_set.coverage_metrics else None,
+            "precision": requirement_set.coverage_metrics.precision if requirement_set.coverage_metrics else None,
+            "misinterpretation_rate": requirement_set.coverage_metrics.misinterpretation_rate if requirement_set.coverage_metrics else None,
+            "traceability_score": requirement_set.coverage_metrics.traceability_score if requirement_set.coverage_metrics else None,
+            "completion_rate": requirement_set.coverage_metrics.completion_rate if requirement_set.coverage_metrics else None,
+            "total_requirements": requirement_set.coverage_metrics.total_requirements if requirement_set.coverage_metrics else None
+        }
+    }
+    
+    # orjson writes UTF-8 without escaping, like ensure_ascii=False, and
+    # datetimes in ISO 8601 as isoformat() does
+    return orjson.dumps(result_data, option=orjson.OPT_INDENT_2)
 
 
 class PipelineService:
@@ -38,13 +133,20 @@ class PipelineService:
     
     def __init__(self, settings: SystemSettings):
         self.settings = settings
-        self.analyzer = AnalyzerService(settings)
-        self.verifier = VerifierService(settings)
+        # Analyzer and Verifier share one LLM client and its connection pool
+        self.llm_service = LLMService(settings)
+        self.analyzer = AnalyzerService(settings, self.llm_service)
+        self.verifier = VerifierService(settings, self.llm_service)
         self.document_parser = DocumentParserService()
+        # Accepted results go to the output directory; rejected or failed
+        # runs to rejected_output. Each is created on first use.
+        self.accepted_dir = Path(settings.output_directory)
+        self.rejected_dir = Path("./rejected_output")
+        self._created_dirs: Set[Path] = set()
         
     async def process_rfp_documents_with_progress(
         self, 
-        document_paths: List[str],
+        document_sources: List[DocumentSource],
         session_id: str,
         set_name: str = None,
         set_description: str = None
@@ -53,7 +155,7 @@ class PipelineService:
         Process RFP documents with real-time progress updates via WebSocket.
         
         Args:
-            document_paths: List of paths to RFP documents
+            document_sources: RFP documents, as file paths or (filename, file object) pairs
             session_id: Unique session ID for WebSocket updates
             set_name: Name for the requirement set
             set_description: Description for the requirement set
@@ -81,7 +183,7 @@ class PipelineService:
         progress.started_at = datetime.now()
 
         # Send initial progress
-        await websocket_manager.send_update(
+        progress_sender.enqueue(
             session_id, 
             ProgressUpdate.create_progress_update(session_id, progress)
         )
@@ -92,76 +194,80 @@ class PipelineService:
                 set_id=str(uuid.uuid4()),
                 name=set_name or f"RFP_Analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
                 description=set_description,
-                source_documents=[Path(p).name for p in document_paths],
+                source_documents=[document_source_name(source) for source in document_sources],
                 pipeline_stage=1
             )
 
             # Step 1: Document Parsing
             progress.update_step("doc_parsing", ProgressStatus.IN_PROGRESS, 0, "문서를 파싱하고 있습니다...")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[0]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[0]))
 
-            documents_content = await self.document_parser.parse_documents(document_paths)
-            
-            progress.update_step("doc_parsing", ProgressStatus.COMPLETED, 100, f"{len(documents_content)}개 문서 파싱 완료")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[0]))
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_progress_update(session_id, progress))
+            # Stage 1 consumes documents as they are parsed; the parsing step is
+            # marked complete once the last document has been handed over
+            documents_content = {}
+            document_stream = self._parse_documents_with_progress(document_sources, documents_content, progress, session_id)
 
             # Stage 1: Initial BR Draft Generation
             progress.update_step("stage1", ProgressStatus.IN_PROGRESS, 0, "초기 비즈니스 요구사항을 추출하고 있습니다...")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[1]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[1]))
             
-            requirement_set = await self._stage_1_initial_draft_with_progress(requirement_set, documents_content, progress, session_id)
+            requirement_set = await self._stage_1_initial_draft_with_progress(requirement_set, document_stream, progress, session_id)
             
             progress.update_step("stage1", ProgressStatus.COMPLETED, 100, f"{len(requirement_set.business_requirements)}개 초기 요구사항 추출 완료")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[1]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[1]))
+            await progress_sender.flush(session_id)
 
             # Stage 2: Self-improvement Pass
             progress.update_step("stage2", ProgressStatus.IN_PROGRESS, 0, "요구사항을 개선하고 있습니다...")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[2]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[2]))
             
             requirement_set = await self._stage_2_self_improvement_with_progress(requirement_set, documents_content, progress, session_id)
             
             progress.update_step("stage2", ProgressStatus.COMPLETED, 100, f"{len(requirement_set.business_requirements)}개 요구사항으로 개선 완료")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[2]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[2]))
+            await progress_sender.flush(session_id)
 
             # Stages 3-5: Verification loop
             progress.update_step("verification_loop", ProgressStatus.IN_PROGRESS, 0, "검증 루프를 시작합니다...")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
             
-            requirement_set = await self._verification_loop_with_progress(requirement_set, documents_content, progress, session_id)
+            requirement_set, critical_errors = await self._verification_loop_with_progress(
+                requirement_set, documents_content, progress, session_id
+            )
             
             progress.update_step("verification_loop", ProgressStatus.COMPLETED, 100, f"{progress.current_iteration}회 반복 후 검증 완료")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
+            await progress_sender.flush(session_id)
 
             # Stage 6: Final Accept/Reject Decision
             progress.update_step("stage6", ProgressStatus.IN_PROGRESS, 0, "최종 판정을 진행합니다...")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[4]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[4]))
             
-            requirement_set = await self._stage_6_final_decision(requirement_set)
+            requirement_set = await self._stage_6_final_decision(requirement_set, critical_errors)
             
             progress.update_step("stage6", ProgressStatus.COMPLETED, 100, f"최종 판정: {requirement_set.status}")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[4]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[4]))
 
             # Final completion
             progress.update_step("completion", ProgressStatus.IN_PROGRESS, 50, "결과를 정리하고 있습니다...")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[5]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[5]))
 
             # Save results to file
             await self._save_results_to_file(requirement_set, session_id)
             
             progress.update_step("completion", ProgressStatus.IN_PROGRESS, 75, "결과를 파일로 저장했습니다...")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[5]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[5]))
 
             # Final progress update
             progress.status = ProgressStatus.COMPLETED
             progress.overall_progress = 100
             progress.update_step("completion", ProgressStatus.COMPLETED, 100, "파이프라인 처리가 완료되었습니다!")
             
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[5]))
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_progress_update(session_id, progress))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[5]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_progress_update(session_id, progress))
 
             # Send completion message with results
-            await websocket_manager.send_update(
+            progress_sender.enqueue(
                 session_id,
                 ProgressUpdate.create_completion(session_id, {
                     "success": True,
@@ -171,13 +277,14 @@ class PipelineService:
                     "iterations": progress.current_iteration
                 })
             )
+            await progress_sender.flush(session_id)
 
             return requirement_set
 
         except Exception as e:
             # Send error update
             progress.status = ProgressStatus.FAILED
-            await websocket_manager.send_update(
+            progress_sender.enqueue(
                 session_id,
                 ProgressUpdate(
                     type="error",
@@ -192,17 +299,20 @@ class PipelineService:
 
     async def process_rfp_documents(
         self, 
-        document_paths: List[str],
+        document_sources: List[DocumentSource],
         set_name: str = None,
-        set_description: str = None
+        set_description: str = None,
+        use_batch_api: bool = False
     ) -> RequirementSet:
         """
         Process RFP documents through the complete 6-stage pipeline.
         
         Args:
-            document_paths: List of paths to RFP documents
+            document_sources: RFP documents, as file paths or (filename, file object) pairs
             set_name: Name for the requirement set
             set_description: Description for the requirement set
+            use_batch_api: Run the LLM calls through the OpenAI Batch API, at
+                half the cost but with up to 24 hours of latency per stage
             
         Returns:
             Complete RequirementSet with all requirements and metrics
@@ -212,25 +322,27 @@ class PipelineService:
             set_id=str(uuid.uuid4()),
             name=set_name or f"RFP_Analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             description=set_description,
-            source_documents=[Path(p).name for p in document_paths],
+            source_documents=[document_source_name(source) for source in document_sources],
             pipeline_stage=1
         )
         
-        # Parse and prepare documents
-        documents_content = await self.document_parser.parse_documents(document_paths)
+        # Parse documents while Stage 1 runs; later stages use the collected content
+        documents_content = {}
+        document_stream = self._parse_documents(document_sources, documents_content)
         
         try:
-            # Stage 1: Initial BR Draft Generation
-            requirement_set = await self._stage_1_initial_draft(requirement_set, documents_content)
-            
-            # Stage 2: Self-improvement Pass
-            requirement_set = await self._stage_2_self_improvement(requirement_set, documents_content)
-            
-            # Stages 3-5: Verification loop
-            requirement_set = await self._verification_loop(requirement_set, documents_content)
+            with self.llm_service.batch_api() if use_batch_api else nullcontext():
+                # Stage 1: Initial BR Draft Generation
+                requirement_set = await self._stage_1_initial_draft(requirement_set, document_stream)
+                
+                # Stage 2: Self-improvement Pass
+                requirement_set = await self._stage_2_self_improvement(requirement_set, documents_content)
+                
+                # Stages 3-5: Verification loop
+                requirement_set, critical_errors = await self._verification_loop(requirement_set, documents_content)
             
             # Stage 6: Final Accept/Reject Decision
-            requirement_set = await self._stage_6_final_decision(requirement_set)
+            requirement_set = await self._stage_6_final_decision(requirement_set, critical_errors)
             
         except Exception as e:
             requirement_set.status = "error"
@@ -240,6 +352,43 @@ class PipelineService:
             
         return requirement_set
     
+    async def _parse_documents(
+        self,
+        document_sources: List[DocumentSource],
+        documents_content: Dict[str, str]
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """Yield parsed documents in upload order, recording each in documents_content."""
+        async for filename, content in self.document_parser.parse_documents_stream(document_sources):
+            documents_content[filename] = content
+            yield filename, content
+    
+    async def _parse_documents_with_progress(
+        self,
+        document_sources: List[DocumentSource],
+        documents_content: Dict[str, str],
+        progress: PipelineProgress,
+        session_id: str
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """_parse_documents that reports the parsing step as each document is done."""
+        total = len(document_sources)
+        parsed = 0
+        async for document in self._parse_documents(document_sources, documents_content):
+            parsed += 1
+            if parsed < total:
+                progress.update_step("doc_parsing", ProgressStatus.IN_PROGRESS, 100 * parsed // total,
+                                   f"문서 {parsed}/{total}개 파싱 완료")
+                progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[0]))
+            yield document
+        
+        progress.update_step("doc_parsing", ProgressStatus.COMPLETED, 100, f"{len(documents_content)}개 문서 파싱 완료")
+        progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[0]))
+        progress_sender.enqueue(session_id, ProgressUpdate.create_progress_update(session_id, progress))
+    
+    async def aclose(self):
+        """Close the LLM client's pooled connections and stop the document parser's workers."""
+        await self.llm_service.aclose()
+        await asyncio.to_thread(self.document_parser.close)
+    
     def get_supported_formats(self) -> List[str]:
         """Get list of supported document formats."""
         return ['.pdf', '.md', '.txt', '.docx', '.pptx', '.xlsx']
@@ -247,7 +396,7 @@ class PipelineService:
     async def _stage_1_initial_draft(
         self, 
         requirement_set: RequirementSet, 
-        documents: Dict[str, str]
+        document_stream: AsyncIterator[Tuple[str, str]]
     ) -> RequirementSet:
         """
         Stage 1: Initial BR Draft Generation
@@ -260,7 +409,7 @@ class PipelineService:
         requirement_set.updated_at = datetime.now()
         
         # Use Analyzer to generate initial draft
-        draft_result = await self.analyzer.generate_initial_draft(documents)
+        draft_result = await self.analyzer.generate_initial_draft_from_stream(document_stream)
         
         requirement_set.business_requirements = draft_result.get('requirements', [])
         requirement_set.hypotheses = draft_result.get('hypotheses', [])
@@ -283,6 +432,9 @@ class PipelineService:
         requirement_set.pipeline_stage = 2
         requirement_set.updated_at = datetime.now()
         
+        if not self._should_self_improve(requirement_set):
+            return requirement_set
+        
         # Use Analyzer to improve the draft
         improved_result = await self.analyzer.self_improvement_pass(
             requirement_set.business_requirements,
@@ -295,11 +447,18 @@ class PipelineService:
         
         return requirement_set
     
+    def _should_self_improve(self, requirement_set: RequirementSet) -> bool:
+        """Whether stage 2 should call the LLM for this draft."""
+        return (
+            not self.settings.pipeline_config.skip_clean_self_improvement
+            or self.analyzer.needs_self_improvement(requirement_set.business_requirements)
+        )
+    
     async def _verification_loop(
         self, 
         requirement_set: RequirementSet, 
         documents: Dict[str, str]
-    ) -> RequirementSet:
+    ) -> Tuple[RequirementSet, List[VerificationIssue]]:
         """
         Stages 3-5: Verification Loop
         
@@ -307,29 +466,35 @@ class PipelineService:
         - Stage 4: Optional bug report review
         - Stage 5: Bug report-based improvements
         - Repeat until acceptance criteria met or max iterations reached
+        
+        Returns:
+            The requirement set and the critical issues of the last verification
         """
         consecutive_passes = 0
         max_iterations = self.settings.pipeline_config.max_iterations
         acceptance_threshold = self.settings.pipeline_config.acceptance_threshold
+        verified_fingerprint = None
+        critical_errors = []
         
         for iteration in range(max_iterations):
             requirement_set.iteration_count = iteration + 1
             
             # Stage 3: Verification & Bug Report
             requirement_set.pipeline_stage = 3
-            verification_result = await self.verifier.verify_requirements(
-                requirement_set.business_requirements,
-                documents
-            )
+            # Unchanged requirements would get the same report, so reuse it
+            fingerprint = _requirements_fingerprint(requirement_set.business_requirements)
+            if fingerprint != verified_fingerprint:
+                verification_result = await self.verifier.verify_requirements(
+                    requirement_set.business_requirements,
+                    documents
+                )
+                verified_fingerprint = fingerprint
             
             requirement_set.verification_issues = verification_result.get('issues', [])
             requirement_set.coverage_metrics = verification_result.get('metrics')
             
             # Check if verification passed (no critical errors)
-            critical_errors = [
-                issue for issue in requirement_set.verification_issues 
-                if issue.error_type == "critical_error"
-            ]
+            critical_errors = verification_result.get('critical_issues', [])
             
             if not critical_errors:
                 consecutive_passes += 1
@@ -356,9 +521,13 @@ class PipelineService:
                 requirement_set.business_requirements = improved_result.get('requirements', [])
                 requirement_set.updated_at = datetime.now()
         
-        return requirement_set
+        return requirement_set, critical_errors
     
-    async def _stage_6_final_decision(self, requirement_set: RequirementSet) -> RequirementSet:
+    async def _stage_6_final_decision(
+        self,
+        requirement_set: RequirementSet,
+        critical_errors: List[VerificationIssue]
+    ) -> RequirementSet:
         """
         Stage 6: Accept/Reject Decision
         
@@ -368,12 +537,7 @@ class PipelineService:
         requirement_set.pipeline_stage = 6
         requirement_set.updated_at = datetime.now()
         
-        # Check for remaining critical errors
-        critical_errors = [
-            issue for issue in requirement_set.verification_issues 
-            if issue.error_type == "critical_error"
-        ]
-        
+        # Critical errors remaining after the last verification
         if not critical_errors:
             requirement_set.status = "accepted"
         else:
@@ -395,7 +559,7 @@ class PipelineService:
     async def _stage_1_initial_draft_with_progress(
         self, 
         requirement_set: RequirementSet, 
-        documents: Dict[str, str],
+        document_stream: AsyncIterator[Tuple[str, str]],
         progress: PipelineProgress,
         session_id: str
     ) -> RequirementSet:
@@ -405,14 +569,22 @@ class PipelineService:
         
         # Update progress: Starting LLM call
         progress.update_step("stage1", ProgressStatus.IN_PROGRESS, 25, "LLM을 호출하여 초기 요구사항을 추출하고 있습니다...")
-        await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[1]))
+        progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[1]))
+        
+        # Report each analyzed document between 25% and 75%; more documents
+        # may still arrive, so never move the bar backwards
+        def report_analyzed(analyzed: int, received: int):
+            percent = max(progress.steps[1].progress_percent, 25 + 50 * analyzed // received)
+            progress.update_step("stage1", ProgressStatus.IN_PROGRESS, percent,
+                               f"문서 {analyzed}/{received}개에서 요구사항 추출 완료")
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[1]))
         
         # Use Analyzer to generate initial draft
-        draft_result = await self.analyzer.generate_initial_draft(documents)
+        draft_result = await self.analyzer.generate_initial_draft_from_stream(document_stream, on_progress=report_analyzed)
         
         # Update progress: Processing results
         progress.update_step("stage1", ProgressStatus.IN_PROGRESS, 75, "추출된 요구사항을 처리하고 있습니다...")
-        await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[1]))
+        progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[1]))
         
         requirement_set.business_requirements = draft_result.get('requirements', [])
         requirement_set.hypotheses = draft_result.get('hypotheses', [])
@@ -432,7 +604,10 @@ class PipelineService:
         
         # Update progress: Starting improvement
         progress.update_step("stage2", ProgressStatus.IN_PROGRESS, 25, "자체 개선 과정을 시작합니다...")
-        await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[2]))
+        progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[2]))
+        
+        if not self._should_self_improve(requirement_set):
+            return requirement_set
         
         # Use Analyzer to improve the draft
         improved_result = await self.analyzer.self_improvement_pass(
@@ -443,7 +618,7 @@ class PipelineService:
         
         # Update progress: Processing improvements
         progress.update_step("stage2", ProgressStatus.IN_PROGRESS, 75, "개선된 요구사항을 적용하고 있습니다...")
-        await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[2]))
+        progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[2]))
         
         requirement_set.business_requirements = improved_result.get('requirements', [])
         requirement_set.hypotheses = improved_result.get('hypotheses', [])
@@ -456,11 +631,13 @@ class PipelineService:
         documents: Dict[str, str],
         progress: PipelineProgress,
         session_id: str
-    ) -> RequirementSet:
+    ) -> Tuple[RequirementSet, List[VerificationIssue]]:
         """Verification loop with progress updates."""
         consecutive_passes = 0
         max_iterations = self.settings.pipeline_config.max_iterations
         acceptance_threshold = self.settings.pipeline_config.acceptance_threshold
+        verified_fingerprint = None
+        critical_errors = []
         
         for iteration in range(max_iterations):
             progress.current_iteration = iteration + 1
@@ -470,30 +647,44 @@ class PipelineService:
             iteration_progress = int((iteration / max_iterations) * 80)  # 80% max for iterations
             progress.update_step("verification_loop", ProgressStatus.IN_PROGRESS, iteration_progress, 
                                f"검증 루프 {iteration + 1}/{max_iterations}회차를 진행하고 있습니다...")
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
-            await websocket_manager.send_update(session_id, ProgressUpdate.create_progress_update(session_id, progress))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
+            progress_sender.enqueue(session_id, ProgressUpdate.create_progress_update(session_id, progress))
             
             # Stage 3: Verification & Bug Report
             requirement_set.pipeline_stage = 3
-            verification_result = await self.verifier.verify_requirements(
-                requirement_set.business_requirements,
-                documents
-            )
+            
+            # Report each percent of requirements verified as the checks
+            # complete, within the first 5% of this iteration's share
+            def report_verified(verified: int, total: int, iteration_progress: int = iteration_progress):
+                if verified * 100 // total == (verified - 1) * 100 // total:
+                    return
+                progress.update_step("verification_loop", ProgressStatus.IN_PROGRESS,
+                                   iteration_progress + 5 * verified // total,
+                                   f"검증 루프 {progress.current_iteration}/{max_iterations}회차: "
+                                   f"요구사항 {verified}/{total}개 검증 완료")
+                progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
+            
+            # Unchanged requirements would get the same report, so reuse it
+            fingerprint = _requirements_fingerprint(requirement_set.business_requirements)
+            if fingerprint != verified_fingerprint:
+                verification_result = await self.verifier.verify_requirements(
+                    requirement_set.business_requirements,
+                    documents,
+                    on_progress=report_verified
+                )
+                verified_fingerprint = fingerprint
             
             requirement_set.verification_issues = verification_result.get('issues', [])
             requirement_set.coverage_metrics = verification_result.get('metrics')
             
             # Check if verification passed (no critical errors)
-            critical_errors = [
-                issue for issue in requirement_set.verification_issues 
-                if issue.error_type == "critical_error"
-            ]
+            critical_errors = verification_result.get('critical_issues', [])
             
             if not critical_errors:
                 consecutive_passes += 1
                 progress.update_step("verification_loop", ProgressStatus.IN_PROGRESS, iteration_progress + 10, 
                                    f"검증 통과! ({consecutive_passes}/{acceptance_threshold})")
-                await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
+                progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
                 
                 if consecutive_passes >= acceptance_threshold:
                     break
@@ -501,7 +692,7 @@ class PipelineService:
                 consecutive_passes = 0
                 progress.update_step("verification_loop", ProgressStatus.IN_PROGRESS, iteration_progress + 5, 
                                    f"{len(critical_errors)}개 오류 발견, 수정 진행 중...")
-                await websocket_manager.send_update(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
+                progress_sender.enqueue(session_id, ProgressUpdate.create_step_update(session_id, progress.steps[3]))
                 
             # Stage 4: Optional Review (if enabled)
             if self.settings.pipeline_config.enable_stage_4_review:
@@ -521,109 +712,33 @@ class PipelineService:
                 requirement_set.business_requirements = improved_result.get('requirements', [])
                 requirement_set.updated_at = datetime.now()
         
-        return requirement_set
+        return requirement_set, critical_errors
 
     
     async def _save_results_to_file(self, requirement_set: RequirementSet, session_id: str):
         """Save pipeline results to JSON file based on acceptance status."""
-        import json
-        from pathlib import Path
         
         # Determine output directory based on status
-        if requirement_set.status == "accepted":
-            output_dir = Path(self.settings.output_directory)
-        else:
-            # For rejected or error status, use rejected_output directory
-            output_dir = Path("./rejected_output")
+        output_dir = self.accepted_dir if requirement_set.status == "accepted" else self.rejected_dir
         
         # Create directory if it doesn't exist
-        output_dir.mkdir(exist_ok=True)
+        if output_dir not in self._created_dirs:
+            await aiofiles.os.makedirs(output_dir, exist_ok=True)
+            self._created_dirs.add(output_dir)
         
         # Generate filename with timestamp and status
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{requirement_set.name}_{timestamp}_{requirement_set.status}_{session_id[:8]}.json"
         filepath = output_dir / filename
         
-        # Prepare data for JSON serialization
-        result_data = {
-            "metadata": {
-                "session_id": session_id,
-                "set_id": requirement_set.set_id,
-                "name": requirement_set.name,
-                "description": requirement_set.description,
-                "status": requirement_set.status,
-                "pipeline_stage": requirement_set.pipeline_stage,
-                "source_documents": requirement_set.source_documents,
-                "created_at": requirement_set.created_at.isoformat() if requirement_set.created_at else None,
-                "updated_at": requirement_set.updated_at.isoformat() if requirement_set.updated_at else None,
-                "total_requirements": len(requirement_set.business_requirements),
-                "total_hypotheses": len(requirement_set.hypotheses),
-                "total_verification_issues": len(requirement_set.verification_issues)
-            },
-            "business_requirements": [
-                {
-                    "requirement_id": req.br_id,
-                    "title": req.title,
-                    "description": req.description,
-                    "category": req.requirement_type,
-                    "priority": req.priority,
-                    "stakeholders": req.stakeholders,
-                    "acceptance_criteria": [
-                        {
-                            "criterion_id": ac.criterion_id,
-                            "description": ac.description,
-                            "testable": ac.testable
-                        } for ac in req.acceptance_criteria
-                    ],
-                    "citations": [
-                        {
-                            "text": citation.text,
-                            "source_document": citation.location.document,
-                            "page_number": citation.location.page_number,
-                            "section": citation.location.section,
-                            "line_number": citation.location.line_number,
-                            "paragraph": citation.location.paragraph,
-                            "context": citation.context
-                        } for citation in req.citations
-                    ],
-                    "tags": req.tags,
-                    "created_at": req.created_at.isoformat() if req.created_at else None
-                } for req in requirement_set.business_requirements
-            ],
-            "hypotheses": [
-                {
-                    "hypothesis_id": hyp.hypothesis_id,
-                    "description": hyp.description,
-                    "confidence_score": hyp.confidence_level,
-                    "supporting_evidence": hyp.evidence_needed,
-                    "created_at": hyp.created_at.isoformat() if hyp.created_at else None
-                } for hyp in requirement_set.hypotheses
-            ],
-            "verification_issues": [
-                {
-                    "issue_id": issue.issue_id,
-                    "error_type": issue.error_type,
-                    "severity": issue.severity,
-                    "description": issue.description,
-                    "affected_requirement_id": issue.br_id,
-                    "suggested_fix": issue.suggested_fix,
-                    "created_at": issue.created_at.isoformat() if issue.created_at else None
-                } for issue in requirement_set.verification_issues
-            ],
-            "coverage_metrics": {
-                "recall": requirement_set.coverage_metrics.recall if requirement_set.coverage_metrics else None,
-                "precision": requirement_set.coverage_metrics.precision if requirement_set.coverage_metrics else None,
-                "misinterpretation_rate": requirement_set.coverage_metrics.misinterpretation_rate if requirement_set.coverage_metrics else None,
-                "traceability_score": requirement_set.coverage_metrics.traceability_score if requirement_set.coverage_metrics else None,
-                "completion_rate": requirement_set.coverage_metrics.completion_rate if requirement_set.coverage_metrics else None,
-                "total_requirements": requirement_set.coverage_metrics.total_requirements if requirement_set.coverage_metrics else None
-            }
-        }
+        # Building and encoding the results walks every requirement and
+        # citation, so do it off the event loop
+        result_json = await asyncio.to_thread(_serialize_results, requirement_set, session_id)
         
         # Write to JSON file
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(result_data, f, indent=2, ensure_ascii=False)
+            async with aiofiles.open(filepath, 'wb') as f:
+                await f.write(result_json)
             
             print(f"📄 Results saved to: {filepath}")
             print(f"   Status: {requirement_set.status}")
@@ -631,5 +746,7 @@ class PipelineService:
             print(f"   Issues: {len(requirement_set.verification_issues)}")
             
         except Exception as e:
+            # The directory may have been removed; recreate it next time
+            self._created_dirs.discard(output_dir)
             print(f"❌ Error saving results: {str(e)}")
             raise e
@@ -3,45 +3,83 @@
 from pathlib import Path
 from typing import Optional
 
+import aiofiles
+import aiofiles.os
+
+
+ANALYZER_PROMPT_FILE = "analyzer_prompt.txt"
+VERIFIER_PROMPT_FILE = "verifier_prompt.txt"
+
+
+def _strip_comments(content: str) -> str:
+    """Remove comment lines starting with # from prompt file content."""
+    lines = [line for line in content.strip().split('\n') if not line.strip().startswith('#')]
+    return '\n'.join(lines).strip()
+
 
 class PromptLoader:
-    """Load system prompts from various sources."""
-    
+    """
+    Load system prompts from various sources.
+
+    The ``a``-prefixed methods do the same file I/O without blocking the
+    event loop and are meant for use from request handlers.
+    """
+
     def __init__(self, prompts_dir: str = "prompts"):
         self.prompts_dir = Path(prompts_dir)
-        
+
     def load_analyzer_prompt(self) -> Optional[str]:
         """Load analyzer system prompt from file."""
-        prompt_file = self.prompts_dir / "analyzer_prompt.txt"
-        if prompt_file.exists():
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                # Remove comment lines starting with #
-                lines = [line for line in content.split('\n') if not line.strip().startswith('#')]
-                return '\n'.join(lines).strip()
-        return None
-        
+        return self._load_prompt(ANALYZER_PROMPT_FILE)
+
     def load_verifier_prompt(self) -> Optional[str]:
         """Load verifier system prompt from file."""
-        prompt_file = self.prompts_dir / "verifier_prompt.txt"
-        if prompt_file.exists():
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                # Remove comment lines starting with #
-                lines = [line for line in content.split('\n') if not line.strip().startswith('#')]
-                return '\n'.join(lines).strip()
-        return None
-        
+        return self._load_prompt(VERIFIER_PROMPT_FILE)
+
     def save_analyzer_prompt(self, prompt: str) -> None:
         """Save analyzer system prompt to file."""
-        self.prompts_dir.mkdir(exist_ok=True)
-        prompt_file = self.prompts_dir / "analyzer_prompt.txt"
-        with open(prompt_file, 'w', encoding='utf-8') as f:
-            f.write(prompt)
-            
+        self._save_prompt(ANALYZER_PROMPT_FILE, prompt)
+
     def save_verifier_prompt(self, prompt: str) -> None:
         """Save verifier system prompt to file."""
+        self._save_prompt(VERIFIER_PROMPT_FILE, prompt)
+
+    async def aload_analyzer_prompt(self) -> Optional[str]:
+        """Load analyzer system prompt from file asynchronously."""
+        return await self._aload_prompt(ANALYZER_PROMPT_FILE)
+
+    async def aload_verifier_prompt(self) -> Optional[str]:
+        """Load verifier system prompt from file asynchronously."""
+        return await self._aload_prompt(VERIFIER_PROMPT_FILE)
+
+    async def asave_analyzer_prompt(self, prompt: str) -> None:
+        """Save analyzer system prompt to file asynchronously."""
+        await self._asave_prompt(ANALYZER_PROMPT_FILE, prompt)
+
+    async def asave_verifier_prompt(self, prompt: str) -> None:
+        """Save verifier system prompt to file asynchronously."""
+        await self._asave_prompt(VERIFIER_PROMPT_FILE, prompt)
+
+    def _load_prompt(self, file_name: str) -> Optional[str]:
+        prompt_file = self.prompts_dir / file_name
+        if prompt_file.exists():
+            with open(prompt_file, 'r', encoding='utf-8') as f:
+                return _strip_comments(f.read())
+        return None
+
+    def _save_prompt(self, file_name: str, prompt: str) -> None:
         self.prompts_dir.mkdir(exist_ok=True)
-        prompt_file = self.prompts_dir / "verifier_prompt.txt"
-        with open(prompt_file, 'w', encoding='utf-8') as f:
-            f.write(prompt)
\ No newline at end of file
+        with open(self.prompts_dir / file_name, 'w', encoding='utf-8') as f:
+            f.write(prompt)
+
+    async def _aload_prompt(self, file_name: str) -> Optional[str]:
+        prompt_file = self.prompts_dir / file_name
+        if await aiofiles.os.path.exists(prompt_file):
+            async with aiofiles.open(prompt_file, 'r', encoding='utf-8') as f:
+                return _strip_comments(await f.read())
+        return None
+
+    async def _asave_prompt(self, file_name: str, prompt: str) -> None:
+        await aiofiles.os.makedirs(self.prompts_dir, exist_ok=True)
+        async with aiofiles.open(self.prompts_dir / file_name, 'w', encoding='utf-8') as f:
+            await f.write(prompt)
@@ -0,0 +1,171 @@
+"""Concurrency and rate limits for LLM API calls."""
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+
+# Response header with the number of requests left in the current rate limit window
+REMAINING_REQUESTS_HEADER = "x-ratelimit-remaining-requests"
+
+
+class AdaptiveSemaphore:
+    """
+    Semaphore whose number of permits follows the provider's rate limits (AIMD).
+
+    The limit starts at ``max_permits``. It is halved whenever a request is
+    rate limited (HTTP 429) or a response reports fewer remaining requests
+    than the current limit, i.e. one more full round of calls would exhaust
+    the window. Every other successful response grows it additively by about
+    one permit per round of calls, back up to ``max_permits``.
+
+    Usage::
+
+        async with semaphore:
+            response = await call()
+            semaphore.on_response(response.headers)
+    """
+
+    def __init__(self, max_permits: int, min_permits: int = 1):
+        self.max_permits = max_permits
+        self.min_permits = min(min_permits, max_permits)
+        # Fractional window so additive increase can be spread over a round
+        self._window = float(max_permits)
+        self._in_use = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of permits."""
+        return int(self._window)
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_use < self.limit)
+            self._in_use += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._condition:
+            self._in_use -= 1
+            self._condition.notify_all()
+
+    def on_response(self, headers: Mapping[str, str]):
+        """Adjust the limit from a successful response's rate limit headers."""
+        remaining = _parse_int(headers.get(REMAINING_REQUESTS_HEADER))
+        if remaining is not None and remaining < self.limit:
+            self._decrease()
+        else:
+            self._window = min(float(self.max_permits), self._window + 1 / self._window)
+
+    def on_rate_limited(self):
+        """Back off after a request was rejected with HTTP 429."""
+        self._decrease()
+
+    def _decrease(self):
+        self._window = max(float(self.min_permits), self._window / 2)
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Read how long the server asked us to wait before retrying, if at all.
+
+    Understands ``retry-after-ms`` (sent by OpenAI) and ``Retry-After`` given
+    either in seconds or as an HTTP date.
+    """
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class TokenBucketLimiter:
+    """
+    Pace requests to stay within requests-per-minute and tokens-per-minute quotas.
+
+    Each quota is a bucket that refills continuously at its per-minute rate and
+    holds at most one minute's worth. ``acquire`` waits until both buckets can
+    cover the request, then takes its share. A quota of 0 is not enforced.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_capacity = float(requests_per_minute)
+        self._token_capacity = float(tokens_per_minute)
+        self._last_refill: Optional[float] = None
+        # Waiters are served one at a time, in arrival order
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.requests_per_minute > 0 or self.tokens_per_minute > 0
+
+    async def acquire(self, tokens: int):
+        """Wait until a request estimated at ``tokens`` tokens fits in both quotas."""
+        if not self.enabled:
+            return
+
+        # A request larger than a whole minute's quota waits for a full bucket
+        tokens = min(tokens, self.tokens_per_minute)
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = max(
+                    _seconds_until(self._request_capacity, 1, self.requests_per_minute),
+                    _seconds_until(self._token_capacity, tokens, self.tokens_per_minute)
+                )
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            self._request_capacity -= 1
+            self._token_capacity -= tokens
+
+    def _refill(self):
+        now = asyncio.get_running_loop().time()
+        if self._last_refill is not None:
+            elapsed_minutes = (now - self._last_refill) / 60
+            self._request_capacity = min(
+                float(self.requests_per_minute),
+                self._request_capacity + elapsed_minutes * self.requests_per_minute
+            )
+            self._token_capacity = min(
+                float(self.tokens_per_minute),
+                self._token_capacity + elapsed_minutes * self.tokens_per_minute
+            )
+        self._last_refill = now
+
+
+def _seconds_until(capacity: float, needed: float, per_minute: int) -> float:
+    """Seconds until a bucket refilling at ``per_minute`` holds ``needed``."""
+    if per_minute <= 0 or capacity >= needed:
+        return 0.0
+    return (needed - capacity) * 60 / per_minute
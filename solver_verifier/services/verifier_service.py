@@ -1,8 +1,9 @@
 """Verifier service - equivalent to Verifier role in Gemini's approach."""
 
+import asyncio
 import uuid
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..models.business_requirement import (
     BusinessRequirement,
@@ -14,21 +15,27 @@ from ..models.agent_config import SystemSettings
 from .llm_service import LLMService
 
 
+# Atomicity checks need no source documents and have short prompts, so they
+# are sent to the LLM in batches of up to this many requirements per request
+ATOMICITY_BATCH_SIZE = 10
+
+
 class VerifierService:
     """
     Verifier service responsible for validating business requirements.
     Equivalent to the Verifier role in Gemini's mathematical problem-solving approach.
     """
     
-    def __init__(self, settings: SystemSettings):
+    def __init__(self, settings: SystemSettings, llm_service: Optional[LLMService] = None):
         self.settings = settings
         self.system_prompt = settings.verifier_system_prompt
-        self.llm_service = LLMService(settings)
+        self.llm_service = llm_service or LLMService(settings)
         
     async def verify_requirements(
         self, 
         requirements: List[BusinessRequirement], 
-        source_documents: Dict[str, str]
+        source_documents: Dict[str, str],
+        on_progress: Optional[Callable[[int, int], None]] = None
     ) -> Dict[str, Any]:
         """
         Stage 3: Verify requirements and generate bug report.
@@ -43,27 +50,55 @@ class VerifierService:
         Args:
             requirements: List of business requirements to verify
             source_documents: Original source documents for cross-referencing
+            on_progress: Called with (verified, total) each time a requirement's
+                checks finish
             
         Returns:
-            Dict containing 'issues' list and 'metrics' object
+            Dict containing 'issues' list, the 'critical_issues' among them
+            and 'metrics' object
         """
         
-        verification_issues = []
+        # Verify all requirements concurrently; the shared LLMService caps how
+        # many LLM calls are in flight. Issues keep the requirement order.
+        batches = [
+            requirements[i:i + ATOMICITY_BATCH_SIZE]
+            for i in range(0, len(requirements), ATOMICITY_BATCH_SIZE)
+        ]
+        verified = 0
+        
+        async def verify(requirement: BusinessRequirement):
+            nonlocal verified
+            result = await self._verify_single_requirement(requirement, source_documents)
+            verified += 1
+            if on_progress is not None:
+                on_progress(verified, len(requirements))
+            return result
+        
+        results, atomicity_batches = await asyncio.gather(
+            asyncio.gather(*(verify(req) for req in requirements)),
+            asyncio.gather(*(self._verify_atomicity_batch(batch) for batch in batches))
+        )
+        atomicity_results = [issues for batch_issues in atomicity_batches for issues in batch_issues]
         
-        # Verify each requirement
-        for req in requirements:
-            req_issues = await self._verify_single_requirement(req, source_documents)
-            verification_issues.extend(req_issues)
+        verification_issues = []
+        for req_issues, atomicity_issues in zip(results, atomicity_results):
+            # Atomicity issues go third, after traceability and semantics
+            verification_issues.extend(req_issues[0])
+            verification_issues.extend(atomicity_issues)
+            verification_issues.extend(req_issues[1])
+        critical_issues = [i for i in verification_issues if i.error_type == ErrorType.CRITICAL_ERROR]
         
         # Calculate coverage metrics
         metrics = await self._calculate_coverage_metrics(
             requirements, 
             verification_issues, 
+            critical_issues,
             source_documents
         )
         
         return {
             'issues': verification_issues,
+            'critical_issues': critical_issues,
             'metrics': metrics
         }
     
@@ -71,35 +106,26 @@ class VerifierService:
         self, 
         requirement: BusinessRequirement, 
         source_documents: Dict[str, str]
-    ) -> List[VerificationIssue]:
+    ) -> Tuple[List[VerificationIssue], List[VerificationIssue]]:
         """
         Verify a single business requirement against source documents.
         
-        Returns list of issues found for this requirement.
+        Atomicity (check 3) is verified in batches by _verify_atomicity_batch,
+        so this returns the issues found before and after it.
         """
-        issues = []
-        
-        # 1. Verify traceability - check citations against source documents
-        traceability_issues = await self._verify_traceability(requirement, source_documents)
-        issues.extend(traceability_issues)
-        
-        # 2. Verify semantic consistency
-        semantic_issues = await self._verify_semantic_consistency(requirement, source_documents)
-        issues.extend(semantic_issues)
-        
-        # 3. Verify atomicity and scope
-        atomicity_issues = await self._verify_atomicity(requirement)
-        issues.extend(atomicity_issues)
-        
-        # 4. Verify numbers and conditions
-        numerical_issues = await self._verify_numerical_accuracy(requirement, source_documents)
-        issues.extend(numerical_issues)
-        
-        # 5. Verify schema compliance
-        schema_issues = await self._verify_schema_compliance(requirement)
-        issues.extend(schema_issues)
+        # The checks are independent, so their LLM calls run concurrently
+        results = await asyncio.gather(
+            # 1. Verify traceability - check citations against source documents
+            self._verify_traceability(requirement, source_documents),
+            # 2. Verify semantic consistency
+            self._verify_semantic_consistency(requirement, source_documents),
+            # 4. Verify numbers and conditions
+            self._verify_numerical_accuracy(requirement, source_documents),
+            # 5. Verify schema compliance
+            self._verify_schema_compliance(requirement)
+        )
         
-        return issues
+        return results[0] + results[1], results[2] + results[3]
     
     async def _verify_traceability(
         self, 
@@ -207,68 +233,87 @@ class VerifierService:
         
         return issues
     
-    async def _verify_atomicity(self, requirement: BusinessRequirement) -> List[VerificationIssue]:
-        """
-        Verify that requirement is atomic (single, focused requirement) using LLM analysis.
+    async def _verify_atomicity_batch(
+        self,
+        requirements: List[BusinessRequirement]
+    ) -> List[List[VerificationIssue]]:
         """
-        issues = []
+        Verify that requirements are atomic (single, focused requirements) using LLM analysis.
         
+        All requirements are checked in one batched LLM request; returns the
+        issues found for each requirement, in order.
+        """
         try:
             # Use LLM to analyze atomicity
-            user_prompt = self._build_atomicity_verification_prompt(requirement)
-            
-            llm_response = await self.llm_service.call_llm_json(
+            llm_responses = await self.llm_service.call_llm_batch(
                 system_prompt=self.system_prompt,
-                user_prompt=user_prompt,
+                user_prompts=[self._build_atomicity_verification_prompt(req) for req in requirements],
                 temperature=0.1
             )
-            
-            # Parse LLM response for atomicity issues
-            if 'atomicity_issues' in llm_response:
-                for issue_data in llm_response['atomicity_issues']:
-                    try:
-                        issue = VerificationIssue(
-                            issue_id=str(uuid.uuid4()),
-                            br_id=requirement.br_id,
-                            error_type=ErrorType.JUSTIFICATION_GAP,
-                            severity=issue_data.get('severity', 'medium'),
-                            description=issue_data.get('description', 'Atomicity violation detected'),
-                            suggested_fix=issue_data.get('suggested_fix', 'Consider splitting into separate atomic requirements')
-                        )
-                        issues.append(issue)
-                    except Exception as e:
-                        print(f"Error parsing atomicity issue: {e}")
-                        continue
-            
         except Exception as e:
             print(f"Atomicity verification LLM call failed, using heuristics: {e}")
-            
-            # Fall back to simple heuristic checks
-            description = requirement.description.lower()
-            
-            # Check for multiple "and" conjunctions suggesting compound requirement
-            if description.count(' and ') > 2:
-                issues.append(VerificationIssue(
-                    issue_id=str(uuid.uuid4()),
-                    br_id=requirement.br_id,
-                    error_type=ErrorType.JUSTIFICATION_GAP,
-                    severity="medium",
-                    description="Requirement may contain multiple requirements (compound)",
-                    suggested_fix="Consider splitting into separate atomic requirements"
-                ))
-            
-            # Check for multiple modal verbs suggesting multiple requirements
-            modal_count = sum(1 for word in ['must', 'should', 'shall', 'will'] 
-                             if f' {word} ' in description)
-            if modal_count > 1:
-                issues.append(VerificationIssue(
-                    issue_id=str(uuid.uuid4()),
-                    br_id=requirement.br_id,
-                    error_type=ErrorType.JUSTIFICATION_GAP,
-                    severity="low",
-                    description="Multiple modal verbs detected - may indicate compound requirement",
-                    suggested_fix="Review requirement for atomicity"
-                ))
+            return [self._atomicity_heuristic_issues(req) for req in requirements]
+        
+        return [
+            self._parse_atomicity_issues(req, llm_response)
+            for req, llm_response in zip(requirements, llm_responses)
+        ]
+    
+    def _parse_atomicity_issues(self, requirement: BusinessRequirement, llm_response: Any) -> List[VerificationIssue]:
+        """Convert one atomicity verification result to issues."""
+        if not isinstance(llm_response, dict):
+            print(f"Unexpected atomicity result for {requirement.br_id}, using heuristics")
+            return self._atomicity_heuristic_issues(requirement)
+        
+        issues = []
+        
+        # Parse LLM response for atomicity issues
+        if 'atomicity_issues' in llm_response:
+            for issue_data in llm_response['atomicity_issues']:
+                try:
+                    issue = VerificationIssue(
+                        issue_id=str(uuid.uuid4()),
+                        br_id=requirement.br_id,
+                        error_type=ErrorType.JUSTIFICATION_GAP,
+                        severity=issue_data.get('severity', 'medium'),
+                        description=issue_data.get('description', 'Atomicity violation detected'),
+                        suggested_fix=issue_data.get('suggested_fix', 'Consider splitting into separate atomic requirements')
+                    )
+                    issues.append(issue)
+                except Exception as e:
+                    print(f"Error parsing atomicity issue: {e}")
+                    continue
+        
+        return issues
+    
+    def _atomicity_heuristic_issues(self, requirement: BusinessRequirement) -> List[VerificationIssue]:
+        """Simple heuristic atomicity checks, used when the LLM is unavailable."""
+        issues = []
+        description = requirement.description.lower()
+        
+        # Check for multiple "and" conjunctions suggesting compound requirement
+        if description.count(' and ') > 2:
+            issues.append(VerificationIssue(
+                issue_id=str(uuid.uuid4()),
+                br_id=requirement.br_id,
+                error_type=ErrorType.JUSTIFICATION_GAP,
+                severity="medium",
+                description="Requirement may contain multiple requirements (compound)",
+                suggested_fix="Consider splitting into separate atomic requirements"
+            ))
+        
+        # Check for multiple modal verbs suggesting multiple requirements
+        modal_count = sum(1 for word in ['must', 'should', 'shall', 'will'] 
+                         if f' {word} ' in description)
+        if modal_count > 1:
+            issues.append(VerificationIssue(
+                issue_id=str(uuid.uuid4()),
+                br_id=requirement.br_id,
+                error_type=ErrorType.JUSTIFICATION_GAP,
+                severity="low",
+                description="Multiple modal verbs detected - may indicate compound requirement",
+                suggested_fix="Review requirement for atomicity"
+            ))
         
         return issues
     
@@ -366,6 +411,7 @@ class VerifierService:
         self, 
         requirements: List[BusinessRequirement],
         issues: List[VerificationIssue],
+        critical_issues: List[VerificationIssue],
         source_documents: Dict[str, str]
     ) -> CoverageMetrics:
         """
@@ -375,8 +421,8 @@ class VerifierService:
         total_requirements = len(requirements)
         
         # Count different types of issues
-        critical_errors = len([i for i in issues if i.error_type == ErrorType.CRITICAL_ERROR])
-        justification_gaps = len([i for i in issues if i.error_type == ErrorType.JUSTIFICATION_GAP])
+        critical_errors = len(critical_issues)
+        justification_gaps = len(issues) - critical_errors
         
         # Calculate metrics (simplified implementation)
         # In real implementation, these would be more sophisticated calculations
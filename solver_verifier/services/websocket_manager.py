@@ -1,8 +1,7 @@
 """WebSocket connection manager for real-time progress updates."""
 
-import json
 import asyncio
-from typing import Dict, Set
+from typing import Dict, List, Set
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
 from ..models.progress import ProgressUpdate
@@ -42,9 +41,20 @@ class WebSocketManager:
         if session_id not in self.active_connections:
             return
         
-        # Convert update to JSON
-        message = update.model_dump_json()
+        await self._send_text(session_id, update.to_json())
+    
+    async def send_batch(self, session_id: str, updates: List[ProgressUpdate]):
+        """Send several updates to a session as a single JSON array frame."""
+        if session_id not in self.active_connections or not updates:
+            return
         
+        if len(updates) == 1:
+            message = updates[0].to_json()
+        else:
+            message = ProgressUpdate.to_json_array(updates)
+        await self._send_text(session_id, message)
+    
+    async def _send_text(self, session_id: str, message: str):
         # Send to all active connections for this session
         connections_to_remove = set()
         
@@ -83,5 +93,84 @@ class WebSocketManager:
             await self.send_update(session_id, update)
 
 
+class BatchingSender:
+    """
+    Coalesces progress updates emitted in quick succession into one frame.
+    
+    Updates are queued per session and a drain task sends everything that
+    accumulated during a short debounce window as a single message, so a
+    burst of step/progress updates costs one WebSocket send instead of many.
+    Updates are delivered in the order they were enqueued.
+    
+    Step and progress updates carry the full state of their step or of the
+    run, so within a batch only the last one per step (and the last progress
+    update) is sent; the earlier ones would be overwritten immediately.
+    """
+    
+    def __init__(self, manager: WebSocketManager, debounce: float = 0.003):
+        self.manager = manager
+        self.debounce = debounce
+        self._queues: Dict[str, List[ProgressUpdate]] = {}
+        self._drain_tasks: Dict[str, asyncio.Task] = {}
+    
+    def enqueue(self, session_id: str, update: ProgressUpdate):
+        """Queue an update for a session without waiting for it to be sent."""
+        if session_id not in self.manager.active_connections:
+            return
+        
+        queue = self._queues.get(session_id)
+        if queue is not None:
+            queue.append(update)
+            return
+        
+        self._queues[session_id] = [update]
+        self._drain_tasks[session_id] = asyncio.create_task(self._drain(session_id))
+    
+    async def flush(self, session_id: str):
+        """Wait until the updates queued for a session have been sent."""
+        drain_task = self._drain_tasks.get(session_id)
+        if drain_task is not None:
+            # Shielded so a cancelled caller does not drop the queued updates
+            await asyncio.shield(drain_task)
+    
+    async def _drain(self, session_id: str):
+        queue = self._queues[session_id]
+        try:
+            # Updates enqueued while a batch is being sent land in the same
+            # list, so keep going until it is empty
+            while queue:
+                await asyncio.sleep(self.debounce)
+                batch = _latest_updates(queue)
+                queue.clear()
+                await self.manager.send_batch(session_id, batch)
+        except Exception as e:
+            print(f"⚠️  Failed to send batched WebSocket updates: {e}")
+        finally:
+            del self._queues[session_id]
+            del self._drain_tasks[session_id]
+
+
+def _latest_updates(updates: List[ProgressUpdate]) -> List[ProgressUpdate]:
+    """Drop step/progress updates superseded by a later one in the same batch."""
+    seen = set()
+    latest = []
+    for update in reversed(updates):
+        if update.type == "step_update":
+            key = (update.type, update.data["step_id"])
+        elif update.type == "progress_update":
+            key = (update.type, None)
+        else:
+            latest.append(update)
+            continue
+        
+        if key not in seen:
+            seen.add(key)
+            latest.append(update)
+    
+    latest.reverse()
+    return latest
+
+
 # Global WebSocket manager instance
-websocket_manager = WebSocketManager()
\ No newline at end of file
+websocket_manager = WebSocketManager()
+progress_sender = BatchingSender(websocket_manager)
\ No newline at end of file
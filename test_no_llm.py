@@ -31,6 +31,7 @@ async def test_document_parsing_only():
         # Test document parser
         parser = DocumentParserService()
         documents = await parser.parse_documents([test_file_path])
+        parser.close()
         
         print("✅ Document parsing successful!")
         print(f"   Documents parsed: {len(documents)}")
@@ -0,0 +1,55 @@
+"""Tests for the analyzer service's conversion of LLM output."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from solver_verifier.models.agent_config import SystemSettings
+from solver_verifier.models.business_requirement import Priority
+from solver_verifier.services.analyzer_service import (
+    MAX_STAGE1_PROMPT_TOKENS,
+    CHARS_PER_TOKEN,
+    AnalyzerService,
+    LLMRequirement,
+    Stage1BudgetError,
+)
+
+
+@pytest.fixture
+def analyzer():
+    return AnalyzerService(SystemSettings(openai_api_key="test"))
+
+
+def convert_priority(analyzer, priority):
+    req = LLMRequirement.model_validate({"요구사항명": "Login", "우선순위": priority})
+    return analyzer._convert_llm_to_requirement(req, datetime.now()).priority
+
+
+@pytest.mark.parametrize("priority, expected", [
+    ("High", Priority.HIGH),
+    ("낮음", Priority.LOW),
+    ("Critical", Priority.CRITICAL),
+    ("중요", Priority.CRITICAL),
+    ("보통", Priority.MEDIUM),
+    (None, Priority.MEDIUM),
+])
+def test_priority_keywords(analyzer, priority, expected):
+    assert convert_priority(analyzer, priority) == expected
+
+
+@pytest.mark.parametrize("priority, expected", [
+    ("critical, otherwise high", Priority.HIGH),
+    ("중요 (낮음)", Priority.LOW),
+    ("low to high", Priority.HIGH),
+    ("critical / low", Priority.LOW),
+])
+def test_mixed_priority_keywords_follow_precedence(analyzer, priority, expected):
+    assert convert_priority(analyzer, priority) == expected
+
+
+def test_stage1_budget_error_is_not_replaced_by_sample_data(analyzer):
+    analyzer.system_prompt = "x" * (MAX_STAGE1_PROMPT_TOKENS * CHARS_PER_TOKEN)
+    
+    with pytest.raises(Stage1BudgetError):
+        asyncio.run(analyzer.generate_initial_draft({"rfp.txt": "The system must support login."}))
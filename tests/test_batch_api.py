@@ -0,0 +1,102 @@
+"""Tests for collecting chat completion requests into Batch API jobs."""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from solver_verifier.services.batch_api import BatchCollector
+
+
+class FakeFiles:
+    def __init__(self):
+        self.contents = {}
+    
+    async def create(self, file, purpose):
+        self.contents["input"] = file[1]
+        return SimpleNamespace(id="input")
+    
+    async def content(self, file_id):
+        return SimpleNamespace(content=self.contents[file_id])
+
+
+class FakeBatches:
+    """Completes each batch on the first status check, failing prompts that say "fail"."""
+    
+    def __init__(self, files, status="completed"):
+        self.files = files
+        self.status = status
+        self.created = 0
+    
+    async def create(self, input_file_id, endpoint, completion_window):
+        self.created += 1
+        return SimpleNamespace(id=f"batch-{self.created}", status="validating",
+                               output_file_id=None, error_file_id=None)
+    
+    async def retrieve(self, batch_id):
+        output, errors = [], []
+        for line in self.files.contents["input"].splitlines():
+            request = orjson.loads(line)
+            prompt = request["body"]["messages"][0]["content"]
+            if prompt == "fail":
+                errors.append(orjson.dumps({
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 400, "body": {"error": "bad request"}},
+                }))
+            elif prompt != "missing":
+                output.append(orjson.dumps({
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 200, "body": {"echo": prompt}},
+                }))
+        self.files.contents["output"] = b"\n".join(output)
+        self.files.contents["errors"] = b"\n".join(errors)
+        return SimpleNamespace(id=batch_id, status=self.status,
+                               output_file_id="output" if output else None,
+                               error_file_id="errors" if errors else None)
+
+
+def make_collector(status="completed"):
+    files = FakeFiles()
+    batches = FakeBatches(files, status)
+    client = SimpleNamespace(files=files, batches=batches)
+    return BatchCollector(client, poll_interval=0, collect_delay=0.01), batches
+
+
+def request(prompt):
+    return {"model": "gpt-4", "messages": [{"role": "user", "content": prompt}]}
+
+
+def test_concurrent_requests_share_one_batch():
+    collector, batches = make_collector()
+    
+    async def main():
+        return await asyncio.gather(*(collector.create(request(p)) for p in ("a", "b", "c")))
+    
+    assert asyncio.run(main()) == [{"echo": "a"}, {"echo": "b"}, {"echo": "c"}]
+    assert batches.created == 1
+
+
+def test_failed_and_missing_requests_raise_for_their_caller_only():
+    collector, _ = make_collector()
+    
+    async def main():
+        return await asyncio.gather(
+            *(collector.create(request(p)) for p in ("ok", "fail", "missing")),
+            return_exceptions=True
+        )
+    
+    ok, failed, missing = asyncio.run(main())
+    assert ok == {"echo": "ok"}
+    assert isinstance(failed, ValueError) and "bad request" in str(failed)
+    assert isinstance(missing, ValueError)
+
+
+def test_batch_without_results_fails_every_request():
+    collector, _ = make_collector(status="expired")
+    
+    async def main():
+        await collector.create(request("missing"))
+    
+    with pytest.raises(ValueError, match="expired"):
+        asyncio.run(main())
@@ -0,0 +1,68 @@
+"""Tests for the on-disk LLM response cache."""
+
+import asyncio
+import os
+import time
+
+from solver_verifier.services.llm_cache import LLMResponseCache
+
+
+REQUEST = {
+    "model": "gpt-4",
+    "messages": [{"role": "user", "content": "요구사항을 추출해주세요"}],
+    "temperature": 0.1,
+}
+
+
+def test_key_does_not_depend_on_parameter_order():
+    reordered = dict(reversed(list(REQUEST.items())))
+    
+    assert LLMResponseCache.make_key(REQUEST) == LLMResponseCache.make_key(reordered)
+
+
+def test_key_changes_with_any_parameter():
+    changed = {**REQUEST, "temperature": 0.2}
+    
+    assert LLMResponseCache.make_key(REQUEST) != LLMResponseCache.make_key(changed)
+
+
+def test_set_then_get(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "cache"))
+    key = cache.make_key(REQUEST)
+    
+    async def main():
+        assert await cache.get(key) is None
+        await cache.set(key, '{"requirements": []}')
+        return await cache.get(key)
+    
+    assert asyncio.run(main()) == '{"requirements": []}'
+    assert [path.name for path in (tmp_path / "cache").iterdir()] == [f"{key}.json"]
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = LLMResponseCache(str(tmp_path), ttl=60)
+    key = cache.make_key(REQUEST)
+    asyncio.run(cache.set(key, "fresh"))
+    
+    assert asyncio.run(cache.get(key)) == "fresh"
+    
+    stale = time.time() - 120
+    os.utime(tmp_path / f"{key}.json", (stale, stale))
+    assert asyncio.run(cache.get(key)) is None
+
+
+def test_entries_never_expire_without_ttl(tmp_path):
+    cache = LLMResponseCache(str(tmp_path))
+    key = cache.make_key(REQUEST)
+    asyncio.run(cache.set(key, "old"))
+    
+    os.utime(tmp_path / f"{key}.json", (0, 0))
+    assert asyncio.run(cache.get(key)) == "old"
+
+
+def test_unreadable_entries_are_misses(tmp_path):
+    cache = LLMResponseCache(str(tmp_path))
+    key = cache.make_key(REQUEST)
+    (tmp_path / f"{key}.json").write_bytes(b"not json")
+    
+    assert asyncio.run(cache.get(key)) is None
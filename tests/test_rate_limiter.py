@@ -0,0 +1,134 @@
+"""Tests for the LLM API concurrency and rate limits."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from solver_verifier.services.rate_limiter import (
+    REMAINING_REQUESTS_HEADER,
+    AdaptiveSemaphore,
+    TokenBucketLimiter,
+    retry_after_seconds,
+)
+
+
+def test_adaptive_semaphore_halves_on_rate_limit():
+    semaphore = AdaptiveSemaphore(8)
+    
+    semaphore.on_rate_limited()
+    assert semaphore.limit == 4
+    semaphore.on_rate_limited()
+    semaphore.on_rate_limited()
+    semaphore.on_rate_limited()
+    assert semaphore.limit == 1
+
+
+def test_adaptive_semaphore_halves_when_few_requests_remain():
+    semaphore = AdaptiveSemaphore(8)
+    
+    semaphore.on_response({REMAINING_REQUESTS_HEADER: "3"})
+    assert semaphore.limit == 4
+
+
+def test_adaptive_semaphore_grows_back_additively():
+    semaphore = AdaptiveSemaphore(8)
+    semaphore.on_rate_limited()
+    
+    # About one permit per round of limit-many responses
+    for _ in range(4):
+        semaphore.on_response({})
+    assert semaphore.limit == 4
+    semaphore.on_response({})
+    assert semaphore.limit == 5
+    for _ in range(100):
+        semaphore.on_response({REMAINING_REQUESTS_HEADER: "1000"})
+    assert semaphore.limit == 8
+
+
+def test_adaptive_semaphore_caps_concurrency():
+    semaphore = AdaptiveSemaphore(2)
+    running = 0
+    peak = 0
+    
+    async def call():
+        nonlocal running, peak
+        async with semaphore:
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+    
+    async def main():
+        await asyncio.gather(*(call() for _ in range(6)))
+    
+    asyncio.run(main())
+    assert peak == 2
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({}, None),
+    ({"retry-after-ms": "1500"}, 1.5),
+    ({"retry-after": "7"}, 7.0),
+    ({"retry-after-ms": "bad", "retry-after": "2"}, 2.0),
+    ({"retry-after": "-3"}, 0.0),
+    ({"retry-after": "soon"}, None),
+])
+def test_retry_after_seconds(headers, expected):
+    assert retry_after_seconds(headers) == expected
+
+
+def test_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    
+    seconds = retry_after_seconds({"retry-after": format_datetime(retry_at, usegmt=True)})
+    assert 28 <= seconds <= 30
+
+
+def test_token_bucket_disabled_without_quotas():
+    limiter = TokenBucketLimiter(0, 0)
+    
+    assert not limiter.enabled
+    asyncio.run(limiter.acquire(10 ** 9))
+
+
+def test_token_bucket_waits_for_request_quota(monkeypatch):
+    limiter = TokenBucketLimiter(requests_per_minute=2, tokens_per_minute=0)
+    sleeps = []
+    
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        # Let the bucket refill as if the time had passed
+        limiter._last_refill -= seconds
+    
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    
+    async def main():
+        for _ in range(3):
+            await limiter.acquire(0)
+    
+    asyncio.run(main())
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(30, abs=0.5)
+
+
+def test_token_bucket_caps_oversized_requests_at_one_minute(monkeypatch):
+    limiter = TokenBucketLimiter(requests_per_minute=0, tokens_per_minute=1000)
+    sleeps = []
+    
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        limiter._last_refill -= seconds
+    
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    
+    async def main():
+        # Larger than the whole quota: takes the full bucket without waiting
+        await limiter.acquire(5000)
+        # The next request waits for half a minute's refill
+        await limiter.acquire(500)
+    
+    asyncio.run(main())
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(30, abs=0.5)
@@ -0,0 +1,70 @@
+"""Tests for serving the built frontend with caching headers."""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from solver_verifier.api.static_files import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    CachedStaticFiles,
+)
+
+
+SCRIPT = b"console.log('hello');" * 20
+
+
+@pytest.fixture
+def client(tmp_path):
+    static_dir = tmp_path / "static" / "js"
+    static_dir.mkdir(parents=True)
+    (static_dir / "main.abc123.js").write_bytes(SCRIPT)
+    (static_dir / "main.abc123.js.gz").write_bytes(gzip.compress(SCRIPT))
+    (tmp_path / "index.html").write_text("<html></html>")
+    
+    app = FastAPI()
+    app.mount("/static", CachedStaticFiles(directory=tmp_path / "static", immutable=True))
+    app.mount("/", CachedStaticFiles(directory=tmp_path, html=True))
+    return TestClient(app)
+
+
+def test_hashed_bundles_are_immutable(client):
+    response = client.get("/static/js/main.abc123.js", headers={"Accept-Encoding": "identity"})
+    
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_index_is_revalidated(client):
+    response = client.get("/")
+    
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+
+def test_precompressed_variant_is_served_when_accepted(client):
+    response = client.get("/static/js/main.abc123.js", headers={"Accept-Encoding": "br;q=0, gzip"})
+    
+    assert response.headers["content-encoding"] == "gzip"
+    assert "javascript" in response.headers["content-type"]
+    assert response.content == SCRIPT
+
+
+def test_refused_encoding_is_not_served(client):
+    response = client.get("/static/js/main.abc123.js", headers={"Accept-Encoding": "gzip;q=0"})
+    
+    assert "content-encoding" not in response.headers
+    assert response.content == SCRIPT
+
+
+def test_unchanged_file_is_not_modified(client):
+    first = client.get("/static/js/main.abc123.js", headers={"Accept-Encoding": "identity"})
+    second = client.get(
+        "/static/js/main.abc123.js",
+        headers={"Accept-Encoding": "identity", "If-None-Match": first.headers["etag"]}
+    )
+    
+    assert second.status_code == 304
@@ -0,0 +1,122 @@
+"""Tests for the streaming multipart upload parser."""
+
+import asyncio
+import io
+
+import pytest
+
+from solver_verifier.api.upload_parser import StreamingUploadParser, UploadRejected
+
+
+BOUNDARY = b"testboundary"
+CONTENT_TYPE = "multipart/form-data; boundary=testboundary"
+ALLOWED = frozenset({".pdf", ".md", ".txt"})
+
+
+def file_part(filename, data):
+    return (
+        b"--" + BOUNDARY
+        + f'\r\nContent-Disposition: form-data; name="files"; filename="{filename}"\r\n\r\n'.encode()
+        + data + b"\r\n"
+    )
+
+
+def field_part(name, value):
+    return (
+        b"--" + BOUNDARY
+        + f'\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode()
+        + value + b"\r\n"
+    )
+
+
+def body(*parts):
+    return b"".join(parts) + b"--" + BOUNDARY + b"--\r\n"
+
+
+def parse(data, inline_threshold=1 << 30, chunk_size=1024):
+    parser = StreamingUploadParser(CONTENT_TYPE, ALLOWED, inline_threshold)
+    
+    async def stream():
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+    
+    documents, fields = asyncio.run(parser.parse(stream()))
+    return parser, documents, fields
+
+
+def test_files_and_fields_are_parsed_in_order():
+    parser, documents, fields = parse(body(
+        field_part("set_name", "요구사항".encode()),
+        file_part("a.pdf", b"%PDF data"),
+        file_part("b.md", b"# heading"),
+    ))
+    
+    assert fields == {"set_name": "요구사항"}
+    assert [(name, file.read()) for name, file in documents] == [("a.pdf", b"%PDF data"), ("b.md", b"# heading")]
+    parser.close()
+
+
+def test_small_uploads_stay_in_memory():
+    parser, documents, _ = parse(body(file_part("a.txt", b"x" * 100)))
+    
+    assert isinstance(documents[0][1], io.BytesIO)
+    parser.close()
+
+
+def test_uploads_spill_to_disk_past_the_threshold():
+    payload = bytes(range(256)) * 64
+    parser, documents, _ = parse(body(
+        file_part("a.txt", payload[:1000]),
+        file_part("b.txt", payload),
+    ), inline_threshold=2000)
+    
+    assert isinstance(documents[0][1], io.BytesIO)
+    assert not isinstance(documents[1][1], io.BytesIO)
+    assert documents[0][1].read() == payload[:1000]
+    assert documents[1][1].read() == payload
+    parser.close()
+
+
+def test_content_hash_does_not_depend_on_spilling():
+    data = body(file_part("a.txt", b"a" * 5000), file_part("b.txt", b"b" * 5000))
+    in_memory, _, _ = parse(data)
+    spilled, _, _ = parse(data, inline_threshold=0)
+    
+    assert in_memory.content_hash == spilled.content_hash
+    in_memory.close()
+    spilled.close()
+
+
+def test_content_hash_separates_file_boundaries():
+    first, _, _ = parse(body(file_part("a.txt", b"a"), file_part("b.txt", b"bc")))
+    second, _, _ = parse(body(file_part("a.txt", b"ab"), file_part("b.txt", b"c")))
+    
+    assert first.content_hash != second.content_hash
+    first.close()
+    second.close()
+
+
+def test_duplicate_filenames_are_disambiguated():
+    parser, documents, _ = parse(body(
+        file_part("a.md", b"1"),
+        file_part("a.md", b"2"),
+        file_part("a.md", b"3"),
+    ))
+    
+    assert [name for name, _ in documents] == ["a.md", "a (2).md", "a (3).md"]
+    parser.close()
+
+
+def test_unsupported_extension_is_rejected():
+    with pytest.raises(UploadRejected, match="Unsupported file format: .exe"):
+        parse(body(file_part("a.txt", b"ok"), file_part("tool.exe", b"MZ")))
+
+
+def test_non_multipart_request_is_rejected():
+    parser = StreamingUploadParser("application/json", ALLOWED, 0)
+    
+    async def stream():
+        yield b"{}"
+    
+    with pytest.raises(UploadRejected):
+        asyncio.run(parser.parse(stream()))
@@ -0,0 +1,70 @@
+"""Tests for batching progress updates sent over WebSocket."""
+
+import asyncio
+from datetime import datetime
+
+from solver_verifier.models.progress import ProgressUpdate
+from solver_verifier.services.websocket_manager import BatchingSender
+
+
+class FakeManager:
+    def __init__(self, session_ids=("s",)):
+        self.active_connections = {session_id: set() for session_id in session_ids}
+        self.sent = []
+    
+    async def send_batch(self, session_id, updates):
+        self.sent.append((session_id, [(update.type, update.data.get("step_id")) for update in updates]))
+
+
+def step_update(step_id, progress):
+    return ProgressUpdate(type="step_update", session_id="s", timestamp=datetime.now(), data={"step_id": step_id, "progress": progress})
+
+
+def progress_update(progress):
+    return ProgressUpdate(type="progress_update", session_id="s", timestamp=datetime.now(), data={"progress": progress})
+
+
+def test_burst_is_sent_as_one_batch_with_superseded_updates_dropped():
+    manager = FakeManager()
+    sender = BatchingSender(manager)
+    
+    async def main():
+        sender.enqueue("s", step_update("stage1", 10))
+        sender.enqueue("s", progress_update(5))
+        sender.enqueue("s", step_update("stage2", 0))
+        sender.enqueue("s", step_update("stage1", 20))
+        sender.enqueue("s", ProgressUpdate(type="error", session_id="s", timestamp=datetime.now(), data={"error": "x"}))
+        sender.enqueue("s", progress_update(10))
+        await sender.flush("s")
+    
+    asyncio.run(main())
+    assert manager.sent == [("s", [
+        ("step_update", "stage2"),
+        ("step_update", "stage1"),
+        ("error", None),
+        ("progress_update", None),
+    ])]
+
+
+def test_updates_for_unconnected_sessions_are_dropped():
+    manager = FakeManager()
+    sender = BatchingSender(manager)
+    
+    async def main():
+        sender.enqueue("other", progress_update(1))
+        await sender.flush("other")
+    
+    asyncio.run(main())
+    assert manager.sent == []
+
+
+def test_flush_waits_for_queued_updates():
+    manager = FakeManager()
+    sender = BatchingSender(manager, debounce=0.05)
+    
+    async def main():
+        sender.enqueue("s", progress_update(1))
+        await sender.flush("s")
+        return list(manager.sent)
+    
+    assert asyncio.run(main()) == [("s", [("progress_update", None)])]